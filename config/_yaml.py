@@ -0,0 +1,47 @@
+"""
+YAML helpers for MCP Base64 Server configuration files.
+
+Configuration files only hold nested mappings of plain scalars, so every
+load and dump goes through PyYAML's safe loader and dumper. The libyaml
+bindings are used when PyYAML was built with them.
+"""
+
+from typing import Any, IO, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+YAMLError = yaml.YAMLError
+
+
+def load(stream: Any) -> Any:
+    """
+    Parse a YAML document.
+    
+    Args:
+        stream: YAML text or a readable file object
+        
+    Returns:
+        Parsed document
+    """
+    return yaml.load(stream, Loader=_Loader)
+
+
+def dump(data: Any, stream: Optional[IO[str]] = None, **kwargs: Any) -> Optional[str]:
+    """
+    Serialize data as YAML.
+    
+    Args:
+        data: Data to serialize
+        stream: Writable file object, or None to return the text
+        **kwargs: Extra options for yaml.dump (e.g. default_flow_style)
+        
+    Returns:
+        YAML text when no stream is given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
@@ -6,18 +6,53 @@ including loading from files, environment variables, and validation.
 """
 
 import os
-import yaml
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 from .config_models import Config
 from .config_validator import ConfigValidator, ConfigValidationError
+from . import _yaml
 
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Environment variable suffix (after ConfigManager.ENV_PREFIX) ->
+# (config section path, field name, value parser). Integer fields are all
+# ports; a value that does not parse is ignored with a warning. Read-only so
+# the table cannot drift between loads.
+_ENV_OVERRIDES: Mapping[str, Tuple[Tuple[str, ...], str, Callable[[str], Any]]] = MappingProxyType({
+    # Server configuration
+    "SERVER_NAME": (("server",), "name", str),
+    "SERVER_VERSION": (("server",), "version", str),
+    # Transport configuration
+    "TRANSPORT_TYPE": (("transport",), "type", str),
+    "TRANSPORT_HTTP_HOST": (("transport", "http"), "host", str),
+    "TRANSPORT_HTTP_PORT": (("transport", "http"), "port", int),
+    # HTTP server configuration
+    "HTTP_SERVER_ENABLED": (("http_server",), "enabled", _parse_bool),
+    "HTTP_SERVER_HOST": (("http_server",), "host", str),
+    "HTTP_SERVER_PORT": (("http_server",), "port", int),
+    # Logging configuration
+    "LOG_LEVEL": (("logging",), "level", str.upper),
+    "LOG_STRUCTURED": (("logging",), "use_structured_format", _parse_bool),
+    "LOG_FILE": (("logging",), "log_file_path", str),
+    "LOG_COLORS": (("logging",), "use_colors", _parse_bool),
+    # Debug configuration
+    "DEBUG_ENABLED": (("debug",), "enabled", _parse_bool),
+    "DEBUG_INSPECTOR_PORT": (("debug",), "inspector_port", int),
+    # Performance monitoring configuration
+    "PERFORMANCE_MONITORING": (("performance",), "monitoring_enabled", _parse_bool),
+})
+
+
 class ConfigManager:
     """
     Configuration manager for loading and managing server configuration.
@@ -63,11 +98,11 @@ class ConfigManager:
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_data = yaml.safe_load(f)
+                    file_data = _yaml.load(f)
                     if file_data:
                         config = Config.from_dict(file_data)
                         logger.info("Configuration loaded from file successfully")
-            except yaml.YAMLError as e:
+            except _yaml.YAMLError as e:
                 logger.error(f"Failed to parse YAML configuration: {e}")
                 raise
             except Exception as e:
@@ -128,7 +163,7 @@ class ConfigManager:
             os.makedirs(os.path.dirname(save_path) if os.path.dirname(save_path) else '.', exist_ok=True)
             
             with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+                _yaml.dump(config_dict, f, default_flow_style=False, indent=2, sort_keys=False, allow_unicode=True)
             
             logger.info(f"Configuration saved to {save_path}")
             
@@ -148,75 +183,24 @@ class ConfigManager:
         """
         logger.debug("Applying environment variable overrides")
         
-        # Server configuration
-        if env_val := os.getenv(f"{self.ENV_PREFIX}SERVER_NAME"):
-            config.server.name = env_val
-            logger.debug(f"Override server.name = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}SERVER_VERSION"):
-            config.server.version = env_val
-            logger.debug(f"Override server.version = {env_val}")
-        
-        # Transport configuration
-        if env_val := os.getenv(f"{self.ENV_PREFIX}TRANSPORT_TYPE"):
-            config.transport.type = env_val
-            logger.debug(f"Override transport.type = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}TRANSPORT_HTTP_HOST"):
-            config.transport.http.host = env_val
-            logger.debug(f"Override transport.http.host = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}TRANSPORT_HTTP_PORT"):
-            try:
-                config.transport.http.port = int(env_val)
-                logger.debug(f"Override transport.http.port = {env_val}")
-            except ValueError:
-                logger.warning(f"Invalid port value in environment: {env_val}")
-        
-        # HTTP server configuration
-        if env_val := os.getenv(f"{self.ENV_PREFIX}HTTP_SERVER_ENABLED"):
-            config.http_server.enabled = env_val.lower() in ('true', '1', 'yes', 'on')
-            logger.debug(f"Override http_server.enabled = {config.http_server.enabled}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}HTTP_SERVER_HOST"):
-            config.http_server.host = env_val
-            logger.debug(f"Override http_server.host = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}HTTP_SERVER_PORT"):
-            try:
-                config.http_server.port = int(env_val)
-                logger.debug(f"Override http_server.port = {env_val}")
-            except ValueError:
-                logger.warning(f"Invalid port value in environment: {env_val}")
-        
-        # Logging configuration
-        if env_val := os.getenv(f"{self.ENV_PREFIX}LOG_LEVEL"):
-            config.logging.level = env_val.upper()
-            logger.debug(f"Override logging.level = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}LOG_STRUCTURED"):
-            config.logging.use_structured_format = env_val.lower() in ('true', '1', 'yes', 'on')
-            logger.debug(f"Override logging.use_structured_format = {config.logging.use_structured_format}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}LOG_FILE"):
-            config.logging.log_file_path = env_val
-            logger.debug(f"Override logging.log_file_path = {env_val}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}LOG_COLORS"):
-            config.logging.use_colors = env_val.lower() in ('true', '1', 'yes', 'on')
-            logger.debug(f"Override logging.use_colors = {config.logging.use_colors}")
-        
-        # Debug configuration
-        if env_val := os.getenv(f"{self.ENV_PREFIX}DEBUG_ENABLED"):
-            config.debug.enabled = env_val.lower() in ('true', '1', 'yes', 'on')
-            logger.debug(f"Override debug.enabled = {config.debug.enabled}")
-        
-        if env_val := os.getenv(f"{self.ENV_PREFIX}DEBUG_INSPECTOR_PORT"):
+        # One lookup per known variable: walking os.environ instead would decode
+        # every unrelated variable in the environment
+        environ = os.environ
+        for suffix, (section_name, field_name, parse) in _ENV_OVERRIDES.items():
+            env_val = environ.get(self.ENV_PREFIX + suffix)
+            if not env_val:
+                continue
             try:
-                config.debug.inspector_port = int(env_val)
-                logger.debug(f"Override debug.inspector_port = {env_val}")
+                value = parse(env_val)
             except ValueError:
                 logger.warning(f"Invalid port value in environment: {env_val}")
+                continue
+            
+            section = config
+            for name in section_name:
+                section = getattr(section, name)
+            setattr(section, field_name, value)
+            logger.debug(f"Override {'.'.join(section_name)}.{field_name} = {value}")
         
         return config
     
@@ -265,5 +249,6 @@ class ConfigManager:
             "transport_type": self._config.transport.type,
             "http_server_enabled": self._config.http_server.enabled,
             "debug_enabled": self._config.debug.enabled,
+            "performance_monitoring_enabled": self._config.performance.monitoring_enabled,
             "config_file": self.config_file
         }
\ No newline at end of file
@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 import os
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class ServerConfig:
     """Server basic configuration."""
     name: str = "mcp-base64-server"
@@ -18,21 +20,21 @@ class ServerConfig:
     description: str = "MCP server providing base64 encoding and decoding tools"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HttpTransportConfig:
     """HTTP transport configuration."""
     host: str = "localhost"
     port: int = 3000
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TransportConfig:
     """Transport layer configuration."""
     type: str = "stdio"  # "stdio" or "http"
     http: HttpTransportConfig = field(default_factory=HttpTransportConfig)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HttpServerConfig:
     """Standalone HTTP server configuration."""
     enabled: bool = False
@@ -40,7 +42,7 @@ class HttpServerConfig:
     port: int = 8080
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -52,14 +54,20 @@ class LoggingConfig:
     use_colors: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DebugConfig:
     """Debug and development configuration."""
     enabled: bool = False
     inspector_port: int = 9000
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class PerformanceConfig:
+    """Performance monitoring configuration."""
+    monitoring_enabled: bool = True
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Config:
     """Main configuration class containing all configuration sections."""
     server: ServerConfig = field(default_factory=ServerConfig)
@@ -67,6 +75,7 @@ class Config:
     http_server: HttpServerConfig = field(default_factory=HttpServerConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     debug: DebugConfig = field(default_factory=DebugConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
 
     @classmethod
     def get_default(cls) -> 'Config':
@@ -75,15 +84,49 @@ class Config:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        def _dataclass_to_dict(obj):
-            if hasattr(obj, '__dataclass_fields__'):
-                return {
-                    field_name: _dataclass_to_dict(getattr(obj, field_name))
-                    for field_name in obj.__dataclass_fields__
+        # Fields are listed explicitly instead of walking __dataclass_fields__;
+        # keep this in sync when adding configuration fields
+        server = self.server
+        transport = self.transport
+        http_server = self.http_server
+        logging_config = self.logging
+        debug = self.debug
+        performance = self.performance
+        return {
+            'server': {
+                'name': server.name,
+                'version': server.version,
+                'description': server.description
+            },
+            'transport': {
+                'type': transport.type,
+                'http': {
+                    'host': transport.http.host,
+                    'port': transport.http.port
                 }
-            return obj
-
-        return _dataclass_to_dict(self)
+            },
+            'http_server': {
+                'enabled': http_server.enabled,
+                'host': http_server.host,
+                'port': http_server.port
+            },
+            'logging': {
+                'level': logging_config.level,
+                'format': logging_config.format,
+                'use_structured_format': logging_config.use_structured_format,
+                'log_file_path': logging_config.log_file_path,
+                'max_file_size': logging_config.max_file_size,
+                'backup_count': logging_config.backup_count,
+                'use_colors': logging_config.use_colors
+            },
+            'debug': {
+                'enabled': debug.enabled,
+                'inspector_port': debug.inspector_port
+            },
+            'performance': {
+                'monitoring_enabled': performance.monitoring_enabled
+            }
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Config':
@@ -136,4 +179,10 @@ class Config:
                 inspector_port=debug_data.get('inspector_port', config.debug.inspector_port)
             )
         
+        if 'performance' in data:
+            performance_data = data['performance']
+            config.performance = PerformanceConfig(
+                monitoring_enabled=performance_data.get('monitoring_enabled', config.performance.monitoring_enabled)
+            )
+        
         return config
\ No newline at end of file
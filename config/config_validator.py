@@ -5,7 +5,7 @@ This module provides validation functionality for configuration data,
 ensuring that all configuration values are valid and consistent.
 """
 
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 from .config_models import Config
 
@@ -18,11 +18,71 @@ class ConfigValidationError(Exception):
         self.errors = errors or []
 
 
+def _is_non_empty_str(value: Any) -> bool:
+    """Check that a value is a non-empty string."""
+    return bool(value) and isinstance(value, str)
+
+
+def _is_valid_port(value: Any) -> bool:
+    """Check that a value is a valid TCP port number."""
+    return isinstance(value, int) and 0 < value <= 65535
+
+
+_VALID_TRANSPORT_TYPES = ["stdio", "http"]
+_VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# Per-field rules: (applies, is_valid, message). A rule is checked only when
+# applies(config) is true (None means always); errors keep this order.
+_Rule = Tuple[Optional[Callable[[Config], bool]], Callable[[Config], bool], str]
+
+_RULES: Tuple[_Rule, ...] = (
+    # Server configuration
+    (None, lambda c: _is_non_empty_str(c.server.name),
+     "Server name must be a non-empty string"),
+    (None, lambda c: _is_non_empty_str(c.server.version),
+     "Server version must be a non-empty string"),
+    (None, lambda c: _is_non_empty_str(c.server.description),
+     "Server description must be a non-empty string"),
+    
+    # Transport configuration
+    (None, lambda c: c.transport.type in _VALID_TRANSPORT_TYPES,
+     f"Transport type must be one of: {_VALID_TRANSPORT_TYPES}"),
+    (lambda c: c.transport.type == "http", lambda c: _is_non_empty_str(c.transport.http.host),
+     "HTTP transport host must be a non-empty string"),
+    (lambda c: c.transport.type == "http", lambda c: _is_valid_port(c.transport.http.port),
+     "HTTP transport port must be a valid port number (1-65535)"),
+    
+    # HTTP server configuration
+    (None, lambda c: isinstance(c.http_server.enabled, bool),
+     "HTTP server enabled must be a boolean"),
+    (lambda c: c.http_server.enabled, lambda c: _is_non_empty_str(c.http_server.host),
+     "HTTP server host must be a non-empty string"),
+    (lambda c: c.http_server.enabled, lambda c: _is_valid_port(c.http_server.port),
+     "HTTP server port must be a valid port number (1-65535)"),
+    
+    # Logging configuration
+    (None, lambda c: c.logging.level in _VALID_LOG_LEVELS,
+     f"Logging level must be one of: {_VALID_LOG_LEVELS}"),
+    (None, lambda c: _is_non_empty_str(c.logging.format),
+     "Logging format must be a non-empty string"),
+    
+    # Debug configuration
+    (None, lambda c: isinstance(c.debug.enabled, bool),
+     "Debug enabled must be a boolean"),
+    (lambda c: c.debug.enabled, lambda c: _is_valid_port(c.debug.inspector_port),
+     "Debug inspector port must be a valid port number (1-65535)"),
+    
+    # Performance monitoring configuration
+    (None, lambda c: isinstance(c.performance.monitoring_enabled, bool),
+     "Performance monitoring enabled must be a boolean"),
+)
+
+
 class ConfigValidator:
     """Configuration validator class."""
     
-    VALID_TRANSPORT_TYPES = ["stdio", "http"]
-    VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    VALID_TRANSPORT_TYPES = _VALID_TRANSPORT_TYPES
+    VALID_LOG_LEVELS = _VALID_LOG_LEVELS
     
     @classmethod
     def validate(cls, config: Config) -> None:
@@ -35,22 +95,11 @@ class ConfigValidator:
         Raises:
             ConfigValidationError: If validation fails
         """
-        errors = []
-        
-        # Validate server configuration
-        errors.extend(cls._validate_server(config.server))
-        
-        # Validate transport configuration
-        errors.extend(cls._validate_transport(config.transport))
-        
-        # Validate HTTP server configuration
-        errors.extend(cls._validate_http_server(config.http_server))
-        
-        # Validate logging configuration
-        errors.extend(cls._validate_logging(config.logging))
-        
-        # Validate debug configuration
-        errors.extend(cls._validate_debug(config.debug))
+        # Per-field rules, evaluated in one pass over the rule table
+        errors = [
+            message for applies, is_valid, message in _RULES
+            if (applies is None or applies(config)) and not is_valid(config)
+        ]
         
         # Validate cross-section dependencies
         errors.extend(cls._validate_dependencies(config))
@@ -61,112 +110,25 @@ class ConfigValidator:
                 errors
             )
     
-    @classmethod
-    def _validate_server(cls, server_config) -> List[str]:
-        """Validate server configuration."""
-        errors = []
-        
-        if not server_config.name or not isinstance(server_config.name, str):
-            errors.append("Server name must be a non-empty string")
-        
-        if not server_config.version or not isinstance(server_config.version, str):
-            errors.append("Server version must be a non-empty string")
-        
-        if not server_config.description or not isinstance(server_config.description, str):
-            errors.append("Server description must be a non-empty string")
-        
-        return errors
-    
-    @classmethod
-    def _validate_transport(cls, transport_config) -> List[str]:
-        """Validate transport configuration."""
-        errors = []
-        
-        if transport_config.type not in cls.VALID_TRANSPORT_TYPES:
-            errors.append(f"Transport type must be one of: {cls.VALID_TRANSPORT_TYPES}")
-        
-        # Validate HTTP transport settings
-        if transport_config.type == "http":
-            if not transport_config.http.host or not isinstance(transport_config.http.host, str):
-                errors.append("HTTP transport host must be a non-empty string")
-            
-            if not isinstance(transport_config.http.port, int) or transport_config.http.port <= 0 or transport_config.http.port > 65535:
-                errors.append("HTTP transport port must be a valid port number (1-65535)")
-        
-        return errors
-    
-    @classmethod
-    def _validate_http_server(cls, http_server_config) -> List[str]:
-        """Validate HTTP server configuration."""
-        errors = []
-        
-        if not isinstance(http_server_config.enabled, bool):
-            errors.append("HTTP server enabled must be a boolean")
-        
-        if http_server_config.enabled:
-            if not http_server_config.host or not isinstance(http_server_config.host, str):
-                errors.append("HTTP server host must be a non-empty string")
-            
-            if not isinstance(http_server_config.port, int) or http_server_config.port <= 0 or http_server_config.port > 65535:
-                errors.append("HTTP server port must be a valid port number (1-65535)")
-        
-        return errors
-    
-    @classmethod
-    def _validate_logging(cls, logging_config) -> List[str]:
-        """Validate logging configuration."""
-        errors = []
-        
-        if logging_config.level not in cls.VALID_LOG_LEVELS:
-            errors.append(f"Logging level must be one of: {cls.VALID_LOG_LEVELS}")
-        
-        if not logging_config.format or not isinstance(logging_config.format, str):
-            errors.append("Logging format must be a non-empty string")
-        
-        return errors
-    
-    @classmethod
-    def _validate_debug(cls, debug_config) -> List[str]:
-        """Validate debug configuration."""
-        errors = []
-        
-        if not isinstance(debug_config.enabled, bool):
-            errors.append("Debug enabled must be a boolean")
-        
-        if debug_config.enabled:
-            if not isinstance(debug_config.inspector_port, int) or debug_config.inspector_port <= 0 or debug_config.inspector_port > 65535:
-                errors.append("Debug inspector port must be a valid port number (1-65535)")
-        
-        return errors
-    
     @classmethod
     def _validate_dependencies(cls, config: Config) -> List[str]:
         """Validate cross-section dependencies."""
         errors = []
         
-        # Check for port conflicts
-        used_ports = []
+        # Check for port conflicts: group enabled services by port in one pass
+        services_by_port: Dict[Any, List[str]] = {}
         
         if config.transport.type == "http":
-            used_ports.append(("MCP HTTP transport", config.transport.http.port))
+            services_by_port.setdefault(config.transport.http.port, []).append("MCP HTTP transport")
         
         if config.http_server.enabled:
-            used_ports.append(("HTTP server", config.http_server.port))
+            services_by_port.setdefault(config.http_server.port, []).append("HTTP server")
         
         if config.debug.enabled:
-            used_ports.append(("Debug inspector", config.debug.inspector_port))
+            services_by_port.setdefault(config.debug.inspector_port, []).append("Debug inspector")
         
-        # Check for duplicate ports
-        port_numbers = [port for _, port in used_ports]
-        if len(port_numbers) != len(set(port_numbers)):
-            port_conflicts = {}
-            for name, port in used_ports:
-                if port_numbers.count(port) > 1:
-                    if port not in port_conflicts:
-                        port_conflicts[port] = []
-                    port_conflicts[port].append(name)
-            
-            for port, services in port_conflicts.items():
+        for port, services in services_by_port.items():
+            if len(services) > 1:
                 errors.append(f"Port {port} is used by multiple services: {', '.join(services)}")
         
         return errors
\ No newline at end of file
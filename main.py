@@ -27,6 +27,7 @@ from config import ConfigManager, Config
 from services.base64_service import Base64Service
 from services.mcp_protocol_handler import MCPProtocolHandler
 from services.logging_service import configure_logging, get_logger
+from services import performance_monitor
 from services.performance_monitor import start_system_monitoring, stop_system_monitoring
 from transports.stdio_transport import StdioTransport
 from transports.http_transport import HTTPTransport
@@ -226,6 +227,8 @@ class MCPBase64Server:
         
         # 设置传输层的请求处理器
         self.transport.set_request_handler(self.mcp_handler.handle_request)
+        self.transport.set_batch_request_handler(self.mcp_handler.handle_requests)
+        self.transport.set_response_serializer(self.mcp_handler.serialize_response)
         
         # 4. 初始化HTTP API服务器（如果启用）
         if self.config.http_server.enabled:
@@ -237,9 +240,14 @@ class MCPBase64Server:
         
         self.logger.info("All components initialized successfully")
         
-        # 启动性能监控
-        start_system_monitoring(interval=5.0)
-        self.logger.info("Performance monitoring started")
+        # 启动性能监控（可通过performance.monitoring_enabled关闭）
+        monitoring_enabled = self.config.performance.monitoring_enabled
+        performance_monitor.set_enabled(monitoring_enabled)
+        if monitoring_enabled:
+            start_system_monitoring(interval=5.0)
+            self.logger.info("Performance monitoring started")
+        else:
+            self.logger.info("Performance monitoring disabled")
     
     def start(self) -> None:
         """
@@ -304,6 +312,10 @@ class MCPBase64Server:
             except Exception as e:
                 self.logger.error(f"Error stopping HTTP server: {e}")
         
+        # 写出协议处理器缓冲的请求日志和性能记录
+        if self.mcp_handler:
+            self.mcp_handler.close()
+        
         # 停止性能监控
         stop_system_monitoring()
         
@@ -13,8 +13,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 import json
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class MCPRequest:
     """
     MCP请求消息结构
@@ -45,7 +47,11 @@ class MCPRequest:
     @classmethod
     def from_json(cls, json_str: str) -> 'MCPRequest':
         """从JSON字符串反序列化为请求对象"""
-        data = json.loads(json_str)
+        return cls.from_dict(json.loads(json_str))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MCPRequest':
+        """从已解析的JSON对象构建请求对象（用于批量请求中的单个元素）"""
         return cls(
             jsonrpc=data.get("jsonrpc", "2.0"),
             id=data.get("id"),
@@ -54,7 +60,7 @@ class MCPRequest:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MCPError:
     """
     MCP错误信息结构
@@ -82,7 +88,7 @@ class MCPError:
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MCPResponse:
     """
     MCP响应消息结构
@@ -101,8 +107,8 @@ class MCPResponse:
     result: Optional[Dict[str, Any]] = None
     error: Optional[MCPError] = None
     
-    def to_json(self) -> str:
-        """将响应对象序列化为JSON字符串"""
+    def to_dict(self) -> Dict[str, Any]:
+        """将响应对象转换为字典格式"""
         response_data = {
             "jsonrpc": self.jsonrpc,
             "id": self.id
@@ -113,7 +119,11 @@ class MCPResponse:
         else:
             response_data["result"] = self.result
             
-        return json.dumps(response_data)
+        return response_data
+    
+    def to_json(self) -> str:
+        """将响应对象序列化为JSON字符串"""
+        return json.dumps(self.to_dict())
     
     @classmethod
     def from_json(cls, json_str: str) -> 'MCPResponse':
@@ -136,7 +146,7 @@ class MCPResponse:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolDefinition:
     """
     MCP工具定义结构
@@ -162,7 +172,7 @@ class ToolDefinition:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolResult:
     """
     工具执行结果结构
@@ -7,9 +7,94 @@ different components of the system.
 """
 
 from typing import Dict, Optional, Any
+import atexit
+import copy
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from models.mcp_models import MCPError, MCPErrorCodes
 
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is an optional speedup
+    fastjsonschema = None
+
+
+# MCP请求的JSON Schema（JSON-RPC 2.0 请求对象）
+MCP_REQUEST_SCHEMA = {
+    "type": "object",
+    "required": ["jsonrpc", "method"],
+    "properties": {
+        "jsonrpc": {"const": "2.0"},
+        "method": {"type": "string"},
+        "id": {"type": ["string", "number", "null"]},
+        "params": {"type": "object"}
+    }
+}
+
+# 模块加载时编译一次，所有请求共享同一个校验函数
+_VALIDATE_REQUEST = fastjsonschema.compile(MCP_REQUEST_SCHEMA) if fastjsonschema is not None else None
+
+# base64字母表（不含填充符'='）；bytes.translate删除这些字符后剩余内容即为非法字符
+_BASE64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+class _PreparedQueueHandler(QueueHandler):
+    """
+    入队前只渲染消息参数的QueueHandler
+    
+    标准QueueHandler会把异常信息格式化进消息并清除exc_info，
+    这里保留exc_info，由根记录器上的格式化器（如结构化格式）照常处理。
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 在调用线程中渲染参数，避免参数对象入队后被修改
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _RootDispatchHandler(logging.Handler):
+    """在监听线程中把记录交给根记录器的处理器，等同于原来的向上传播"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().callHandlers(record)
+
+
+# 默认记录器及其队列监听器，首次创建使用默认记录器的ErrorHandler时初始化，全进程共享一份
+_default_logger: Optional[logging.Logger] = None
+_default_log_listener: Optional[QueueListener] = None
+_default_logger_lock = threading.Lock()
+
+
+def _get_default_logger() -> logging.Logger:
+    """
+    获取ErrorHandler的默认记录器
+    
+    默认记录器只把记录放入队列，由后台QueueListener线程写出，
+    错误路径不会阻塞在stderr或日志文件的I/O上。
+    初始化后直接返回缓存的记录器，不再查找logging的记录器注册表。
+    """
+    global _default_logger, _default_log_listener
+    logger = _default_logger
+    if logger is not None:
+        return logger
+    with _default_logger_lock:
+        if _default_logger is None:
+            logger = logging.getLogger(__name__)
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, _RootDispatchHandler())
+            listener.start()
+            # 退出时写完队列中剩余的记录
+            atexit.register(listener.stop)
+            logger.addHandler(_PreparedQueueHandler(log_queue))
+            logger.propagate = False
+            _default_log_listener = listener
+            _default_logger = logger
+        return _default_logger
+
 
 class ErrorHandler:
     """
@@ -26,7 +111,7 @@ class ErrorHandler:
         Args:
             logger: 可选的日志记录器，如果未提供则创建默认记录器
         """
-        self.logger = logger or logging.getLogger(__name__)
+        self.logger = logger or _get_default_logger()
     
     def create_error(self, code: int, message: str, data: Optional[Dict[str, Any]] = None) -> MCPError:
         """
@@ -41,7 +126,8 @@ class ErrorHandler:
             MCPError: 标准化的错误对象
         """
         error = MCPError(code=code, message=message, data=data)
-        self.logger.error(f"Error created - Code: {code}, Message: {message}, Data: {data}")
+        # 延迟格式化：日志级别被关闭时不会渲染消息
+        self.logger.error("Error created - Code: %s, Message: %s, Data: %s", code, message, data)
         return error
     
     def create_parse_error(self, details: str = "Invalid JSON format") -> MCPError:
@@ -128,27 +214,42 @@ class ErrorHandler:
             MCPError: 转换后的MCP错误对象
         """
         error_message = f"{context}: {str(exception)}" if context else str(exception)
-        self.logger.exception(f"Exception handled: {error_message}")
-        
-        # 根据异常类型创建相应的错误
-        if isinstance(exception, ValueError):
-            return self.create_invalid_params_error(error_message)
-        elif isinstance(exception, KeyError):
-            return self.create_invalid_request_error(error_message)
-        elif isinstance(exception, NotImplementedError):
-            return self.create_internal_error(f"Feature not implemented: {error_message}")
-        elif isinstance(exception, TypeError):
-            return self.create_invalid_params_error(f"Type error: {error_message}")
-        elif isinstance(exception, AttributeError):
-            return self.create_internal_error(f"Attribute error: {error_message}")
-        elif isinstance(exception, ImportError):
-            return self.create_internal_error(f"Import error: {error_message}")
-        elif isinstance(exception, ConnectionError):
-            return self.create_internal_error(f"Connection error: {error_message}")
-        elif isinstance(exception, TimeoutError):
-            return self.create_internal_error(f"Timeout error: {error_message}")
+        self.logger.exception("Exception handled: %s", error_message)
+        
+        # 按异常类型查表；未见过的类型解析一次后写回表中，之后同类型异常只需一次哈希查找
+        exception_type = type(exception)
+        dispatch = self._EXC_DISPATCH.get(exception_type)
+        if dispatch is None:
+            dispatch = self._resolve_exception_dispatch(exception_type)
+        factory, prefix = dispatch
+        return factory(self, f"{prefix}{error_message}")
+    
+    @classmethod
+    def _resolve_exception_dispatch(cls, exception_type: type) -> tuple:
+        """按_EXC_RULES的顺序匹配第一个基类（与原isinstance链语义一致）并缓存结果"""
+        for base, factory, prefix in cls._EXC_RULES:
+            if issubclass(exception_type, base):
+                dispatch = (factory, prefix)
+                break
         else:
-            return self.create_internal_error(error_message)
+            dispatch = (cls.create_internal_error, "")
+        cls._EXC_DISPATCH[exception_type] = dispatch
+        return dispatch
+    
+    # 异常基类 -> 错误工厂方法和详情前缀，按优先级排列；子类异常匹配第一个命中的基类
+    _EXC_RULES = (
+        (ValueError, create_invalid_params_error, ""),
+        (KeyError, create_invalid_request_error, ""),
+        (NotImplementedError, create_internal_error, "Feature not implemented: "),
+        (TypeError, create_invalid_params_error, "Type error: "),
+        (AttributeError, create_internal_error, "Attribute error: "),
+        (ImportError, create_internal_error, "Import error: "),
+        (ConnectionError, create_internal_error, "Connection error: "),
+        (TimeoutError, create_internal_error, "Timeout error: "),
+    )
+    
+    # 异常类型 -> (错误工厂方法, 详情前缀)；预置规则中的精确类型，其余类型首次出现时解析并缓存
+    _EXC_DISPATCH = {base: (factory, prefix) for base, factory, prefix in _EXC_RULES}
     
     def validate_request_format(self, request_data: dict) -> MCPError:
         """
@@ -160,6 +261,15 @@ class ErrorHandler:
         Returns:
             MCPError: 如果验证失败返回错误对象，否则返回None
         """
+        # 快速路径：合法请求只需一次编译后的schema校验
+        if _VALIDATE_REQUEST is not None:
+            try:
+                _VALIDATE_REQUEST(request_data)
+                return None
+            except fastjsonschema.JsonSchemaException:
+                # 回退到逐项检查以生成详细的错误信息
+                pass
+        
         # 检查必需字段
         if not isinstance(request_data, dict):
             return self.create_invalid_request_error("Request must be a JSON object")
@@ -179,7 +289,7 @@ class ErrorHandler:
         # 检查可选字段格式
         if "id" in request_data:
             id_value = request_data["id"]
-            if not (isinstance(id_value, (str, int)) or id_value is None):
+            if not (isinstance(id_value, (str, int, float)) or id_value is None):
                 return self.create_invalid_request_error("'id' field must be string, number, or null")
         
         if "params" in request_data:
@@ -204,17 +314,22 @@ class ErrorHandler:
         if not base64_string.strip():
             return self.create_invalid_base64_error("Base64 string cannot be empty")
         
-        # 检查base64字符集
-        import re
-        base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-        if not base64_pattern.match(base64_string.replace('\n', '').replace('\r', '').replace(' ', '')):
+        # 去除空白字符；非ASCII字符必然不是合法base64
+        try:
+            clean_string = base64_string.encode('ascii').translate(None, b'\n\r ')
+        except UnicodeEncodeError:
             return self.create_invalid_base64_error("Base64 string contains invalid characters")
         
-        # 检查长度是否为4的倍数（去除空白字符后）
-        clean_string = base64_string.replace('\n', '').replace('\r', '').replace(' ', '')
+        # 先做O(1)的长度检查（去除空白字符后须为4的倍数），长度不合法时无需扫描字符集
         if len(clean_string) % 4 != 0:
             return self.create_invalid_base64_error("Base64 string length must be a multiple of 4")
         
+        # 检查base64字符集：末尾最多两个'='，其余字符都必须在字母表内。
+        # bytes.translate在C层一次扫描完成，长输入比逐字符匹配的正则快得多
+        body = clean_string.rstrip(b'=')
+        if len(clean_string) - len(body) > 2 or body.translate(None, _BASE64_ALPHABET):
+            return self.create_invalid_base64_error("Base64 string contains invalid characters")
+        
         return None
     
     def create_http_error_response(self, status_code: int, message: str, details: str = None) -> dict:
@@ -229,17 +344,10 @@ class ErrorHandler:
         Returns:
             dict: HTTP错误响应字典
         """
-        response = {
-            "success": False,
-            "error": {
-                "code": status_code,
-                "message": message
-            }
-        }
-        
+        error = {"code": status_code, "message": message}
         if details:
-            response["error"]["details"] = details
+            error["details"] = details
         
-        self.logger.error(f"HTTP Error Response - Status: {status_code}, Message: {message}, Details: {details}")
+        self.logger.error("HTTP Error Response - Status: %s, Message: %s, Details: %s", status_code, message, details)
         
-        return response
\ No newline at end of file
+        return {"success": False, "error": error}
\ No newline at end of file
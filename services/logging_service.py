@@ -11,12 +11,40 @@ import logging.handlers
 import sys
 import json
 import time
+import functools
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+from utils.compat import DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(data: Any) -> str:
+        """Serialize log data to a compact JSON string using orjson."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+else:
+    _dumps = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+# Level name -> numeric logging level
+_LEVEL_MAP: Dict[str, int] = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# Display form of each logger name as shown by HumanReadableFormatter
+_LOGGER_DISPLAY_NAMES: Dict[str, str] = {}
+
 
 class LogLevel(Enum):
     """Log level enumeration."""
@@ -27,7 +55,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LogEntry:
     """Structured log entry data class."""
     timestamp: str
@@ -41,11 +69,20 @@ class LogEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert log entry to dictionary."""
-        return asdict(self)
+        return {
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'logger_name': self.logger_name,
+            'message': self.message,
+            'module': self.module,
+            'function': self.function,
+            'line_number': self.line_number,
+            'extra_data': self.extra_data
+        }
     
     def to_json(self) -> str:
         """Convert log entry to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return _dumps(self.to_dict())
 
 
 class StructuredFormatter(logging.Formatter):
@@ -72,9 +109,9 @@ class StructuredFormatter(logging.Formatter):
             level=record.levelname,
             logger_name=record.name,
             message=record.getMessage(),
-            module=record.module if hasattr(record, 'module') else None,
-            function=record.funcName if hasattr(record, 'funcName') else None,
-            line_number=record.lineno if hasattr(record, 'lineno') else None,
+            module=record.module,
+            function=record.funcName,
+            line_number=record.lineno,
             extra_data=getattr(record, 'extra_data', None)
         )
         
@@ -108,6 +145,27 @@ class HumanReadableFormatter(logging.Formatter):
         """
         super().__init__()
         self.use_colors = use_colors and sys.stderr.isatty()
+        
+        # Pre-assembled output template per level (colored level already embedded)
+        self._templates: Dict[str, str] = {}
+        for level in self.COLORS:
+            if level != 'RESET':
+                self._templates[level] = self._build_template(level)
+    
+    def _build_template(self, level: str) -> str:
+        """
+        Build the str.format template for a log level.
+        
+        Args:
+            level: Level name of the record
+            
+        Returns:
+            Format template with the (optionally colored) level embedded
+        """
+        if self.use_colors and level in self.COLORS:
+            level = f"{self.COLORS[level]}{level}{self.COLORS['RESET']}"
+        level = f"{level:8}".replace('{', '{{').replace('}', '}}')
+        return "{ts} | " + level + " | {name:20} | {msg}{extra}{loc}"
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -122,15 +180,13 @@ class HumanReadableFormatter(logging.Formatter):
         # Format timestamp
         timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
         
-        # Format level with color
-        level = record.levelname
-        if self.use_colors and level in self.COLORS:
-            level = f"{self.COLORS[level]}{level}{self.COLORS['RESET']}"
-        
-        # Format logger name (truncate if too long)
-        logger_name = record.name
-        if len(logger_name) > 20:
-            logger_name = f"...{logger_name[-17:]}"
+        # Format logger name (truncate if too long, cached per logger name)
+        logger_name = _LOGGER_DISPLAY_NAMES.get(record.name)
+        if logger_name is None:
+            logger_name = record.name
+            if len(logger_name) > 20:
+                logger_name = f"...{logger_name[-17:]}"
+            _LOGGER_DISPLAY_NAMES[record.name] = logger_name
         
         # Format message
         message = record.getMessage()
@@ -138,14 +194,25 @@ class HumanReadableFormatter(logging.Formatter):
         # Add extra data if present
         extra_info = ""
         if hasattr(record, 'extra_data') and record.extra_data:
-            extra_info = f" | {json.dumps(record.extra_data, ensure_ascii=False)}"
+            extra_info = f" | {_dumps(record.extra_data)}"
         
         # Format location info for debug level
         location_info = ""
         if record.levelno <= logging.DEBUG:
             location_info = f" [{record.filename}:{record.lineno}]"
         
-        return f"{timestamp} | {level:8} | {logger_name:20} | {message}{extra_info}{location_info}"
+        # Level-specific template (custom levels are built on first use)
+        template = self._templates.get(record.levelname)
+        if template is None:
+            template = self._templates[record.levelname] = self._build_template(record.levelname)
+        
+        return template.format(
+            ts=timestamp,
+            name=logger_name,
+            msg=message,
+            extra=extra_info,
+            loc=location_info
+        )
 
 
 class LoggingService:
@@ -165,6 +232,7 @@ class LoggingService:
         self._log_level = logging.INFO
         self._use_structured_format = False
         self._log_file_path: Optional[Path] = None
+        self._log_file_path_str: Optional[str] = None
         
     def configure(
         self,
@@ -191,9 +259,10 @@ class LoggingService:
             return
         
         # Set configuration
-        self._log_level = getattr(logging, level.upper())
+        self._log_level = _LEVEL_MAP[level.upper()]
         self._use_structured_format = use_structured_format
         self._log_file_path = Path(log_file_path) if log_file_path else None
+        self._log_file_path_str = str(self._log_file_path) if self._log_file_path else None
         
         # Clear existing handlers
         self._clear_handlers()
@@ -221,7 +290,7 @@ class LoggingService:
             'extra_data': {
                 'level': level,
                 'structured_format': use_structured_format,
-                'log_file': str(self._log_file_path) if self._log_file_path else None,
+                'log_file': self._log_file_path_str,
                 'handlers_count': len(self._handlers)
             }
         })
@@ -259,7 +328,7 @@ class LoggingService:
         
         # Create rotating file handler
         file_handler = logging.handlers.RotatingFileHandler(
-            filename=str(self._log_file_path),
+            filename=self._log_file_path_str,
             maxBytes=max_file_size,
             backupCount=backup_count,
             encoding='utf-8'
@@ -274,7 +343,9 @@ class LoggingService:
     
     def _clear_handlers(self) -> None:
         """Clear all existing handlers."""
+        root_logger = logging.getLogger()
         for handler in self._handlers:
+            root_logger.removeHandler(handler)
             handler.close()
         self._handlers.clear()
     
@@ -338,10 +409,12 @@ class LoggingService:
             message += f" ({duration_ms:.2f}ms)"
         
         # Log with appropriate level
-        log_level = getattr(logging, level.upper())
+        log_level = _LEVEL_MAP.get(level)
+        if log_level is None:
+            log_level = _LEVEL_MAP[level.upper()]
         logger.log(log_level, message, extra={'extra_data': log_data})
     
-    def log_request(
+    def make_request_record(
         self,
         logger_name: str,
         method: str,
@@ -350,9 +423,13 @@ class LoggingService:
         duration_ms: Optional[float] = None,
         client_info: Optional[Dict[str, Any]] = None,
         extra_data: Optional[Dict[str, Any]] = None
-    ) -> None:
+    ) -> Optional[logging.LogRecord]:
         """
-        Log a request with structured data.
+        Build a request log record without emitting it.
+        
+        The record carries the creation time and thread of the caller, so it
+        can be handed to Logger.handle() later (e.g. from a flush thread)
+        without changing what is logged.
         
         Args:
             logger_name: Name of the logger
@@ -362,9 +439,21 @@ class LoggingService:
             duration_ms: Request duration in milliseconds
             client_info: Client information
             extra_data: Additional data to include
+            
+        Returns:
+            The log record, or None if the record's level is disabled
         """
         logger = self.get_logger(logger_name)
         
+        # Determine log level based on status
+        if status_code and status_code >= 400:
+            level = logging.WARNING if status_code < 500 else logging.ERROR
+        else:
+            level = logging.INFO
+        
+        if not logger.isEnabledFor(level):
+            return None
+        
         # Prepare log data
         log_data = {
             'request_method': method,
@@ -386,13 +475,39 @@ class LoggingService:
         if duration_ms is not None:
             message += f" ({duration_ms:.2f}ms)"
         
-        # Determine log level based on status
-        if status_code and status_code >= 400:
-            level = logging.WARNING if status_code < 500 else logging.ERROR
-        else:
-            level = logging.INFO
+        fn, lno, func, sinfo = logger.findCaller()
+        return logger.makeRecord(
+            logger.name, level, fn, lno, message, (), None,
+            func=func, extra={'extra_data': log_data}, sinfo=sinfo
+        )
+    
+    def log_request(
+        self,
+        logger_name: str,
+        method: str,
+        path: Optional[str] = None,
+        status_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
+        client_info: Optional[Dict[str, Any]] = None,
+        extra_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Log a request with structured data.
         
-        logger.log(level, message, extra={'extra_data': log_data})
+        Args:
+            logger_name: Name of the logger
+            method: Request method (e.g., 'POST', 'call_tool')
+            path: Request path (for HTTP requests)
+            status_code: Response status code
+            duration_ms: Request duration in milliseconds
+            client_info: Client information
+            extra_data: Additional data to include
+        """
+        record = self.make_request_record(
+            logger_name, method, path, status_code, duration_ms, client_info, extra_data
+        )
+        if record is not None:
+            self.get_logger(logger_name).handle(record)
     
     def log_error(
         self,
@@ -412,10 +527,16 @@ class LoggingService:
         """
         logger = self.get_logger(logger_name)
         
+        # Skip building log data and formatting the traceback if nothing will consume it
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+        
         # Prepare log data
+        error_type = type(error).__name__
+        error_text = str(error)
         log_data = {
-            'error_type': type(error).__name__,
-            'error_message': str(error),
+            'error_type': error_type,
+            'error_message': error_text,
             'context': context
         }
         
@@ -423,7 +544,7 @@ class LoggingService:
             log_data.update(extra_data)
         
         # Format message
-        message = f"Error: {type(error).__name__}: {str(error)}"
+        message = f"Error: {error_type}: {error_text}"
         if context:
             message = f"{context} - {message}"
         
@@ -440,7 +561,7 @@ class LoggingService:
             'configured': self._configured,
             'log_level': logging.getLevelName(self._log_level),
             'structured_format': self._use_structured_format,
-            'log_file': str(self._log_file_path) if self._log_file_path else None,
+            'log_file': self._log_file_path_str,
             'handlers_count': len(self._handlers),
             'loggers_count': len(self._loggers)
         }
@@ -549,6 +670,36 @@ def log_operation(
     )
 
 
+def make_request_record(
+    logger_name: str,
+    method: str,
+    path: Optional[str] = None,
+    status_code: Optional[int] = None,
+    duration_ms: Optional[float] = None,
+    client_info: Optional[Dict[str, Any]] = None,
+    extra_data: Optional[Dict[str, Any]] = None
+) -> Optional[logging.LogRecord]:
+    """
+    Build a request log record to be emitted later with Logger.handle().
+    
+    Args:
+        logger_name: Name of the logger
+        method: Request method (e.g., 'POST', 'call_tool')
+        path: Request path (for HTTP requests)
+        status_code: Response status code
+        duration_ms: Request duration in milliseconds
+        client_info: Client information
+        extra_data: Additional data to include
+        
+    Returns:
+        The log record, or None if the record's level is disabled
+    """
+    service = get_logging_service()
+    return service.make_request_record(
+        logger_name, method, path, status_code, duration_ms, client_info, extra_data
+    )
+
+
 def log_request(
     logger_name: str,
     method: str,
@@ -9,17 +9,194 @@ The handler follows the MCP specification for JSON-RPC 2.0 based communication
 and provides standardized tool interfaces for AI agents.
 """
 
+import json
 import logging
+import sys
+import threading
 import time
-from typing import Dict, List, Any, Optional
+import weakref
+from collections import deque
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, List, Any, Mapping, Optional, Tuple, Union
 from models.mcp_models import (
     MCPRequest, MCPResponse, MCPError, ToolDefinition, ToolResult,
     MCPMethods, MCPErrorCodes, BASE64_ENCODE_TOOL, BASE64_DECODE_TOOL
 )
 from services.base64_service import Base64Service
 from services.error_handler import ErrorHandler
-from services.logging_service import get_logger, log_request, log_operation, log_error
-from services.performance_monitor import record_request
+from services.logging_service import get_logger, log_request, log_operation, log_error, make_request_record
+from services import performance_monitor
+from services.performance_monitor import RequestMetricsHandle, get_performance_monitor
+
+
+# 请求日志和性能记录缓冲区的刷新阈值及后台刷新间隔（秒）。
+# 缓冲条目数达到阈值时由请求线程直接写出，记录不会被丢弃
+LOG_BUFFER_SIZE = 1024
+LOG_FLUSH_INTERVAL = 0.05
+
+# 缓冲条目：(日志/记录函数, 位置参数, 关键字参数)。
+# 日志记录在请求线程中构建，时间戳和线程信息取自请求发生时，刷新时只负责写出
+_LogRecord = Tuple[Callable[..., None], tuple, Dict[str, Any]]
+
+
+def _flush_loop(handler_ref: 'weakref.ReferenceType[MCPProtocolHandler]', stop_event: threading.Event) -> None:
+    """
+    后台刷新循环
+    
+    定期将协议处理器缓冲的请求日志和性能记录写出。只持有处理器的弱引用，
+    处理器被回收后循环自动结束。
+    
+    Args:
+        handler_ref: 协议处理器的弱引用
+        stop_event: 停止事件
+    """
+    while not stop_event.wait(LOG_FLUSH_INTERVAL):
+        handler = handler_ref()
+        if handler is None:
+            return
+        handler.flush()
+        del handler
+
+
+# 固定内容的错误对象，只构建一次，由各响应共享
+_ERR_INVALID_REQUEST = MCPError(
+    code=MCPErrorCodes.INVALID_REQUEST,
+    message="Invalid request format"
+)
+_ERR_MISSING_TOOL_NAME = MCPError(
+    code=MCPErrorCodes.INVALID_PARAMS,
+    message="Missing required parameter: name"
+)
+
+
+@lru_cache(maxsize=64)
+def _method_not_found_error(method: str) -> MCPError:
+    """
+    获取方法未找到错误对象
+    
+    错误对象只依赖方法名，按方法名缓存以避免重复构建。
+    
+    Args:
+        method: 请求的方法名称
+        
+    Returns:
+        MCPError: 方法未找到错误
+    """
+    return MCPError(
+        code=MCPErrorCodes.METHOD_NOT_FOUND,
+        message=f"Method '{method}' not found"
+    )
+
+
+@lru_cache(maxsize=64)
+def _tool_not_found_error(tool_name: str) -> MCPError:
+    """
+    获取工具未找到错误对象
+    
+    错误对象只依赖工具名，按工具名缓存以避免重复构建。
+    
+    Args:
+        tool_name: 请求的工具名称
+        
+    Returns:
+        MCPError: 工具未找到错误
+    """
+    return MCPError(
+        code=MCPErrorCodes.TOOL_NOT_FOUND,
+        message=f"Tool '{tool_name}' not found"
+    )
+
+
+def mcp_errorwrap(code: int, log_context: str) -> Callable[[Callable[..., MCPResponse]], Callable[..., MCPResponse]]:
+    """
+    将请求处理方法中的异常转换为MCP错误响应的装饰器
+    
+    ValueError视为业务逻辑错误，使用指定的错误代码返回；其他异常记录日志后
+    交给ErrorHandler转换。被装饰方法的第一个参数必须是MCP请求对象。
+    
+    Args:
+        code: ValueError对应的MCP错误代码
+        log_context: 未预期异常的日志描述
+        
+    Returns:
+        Callable: 装饰器
+    """
+    def decorator(fn: Callable[..., MCPResponse]) -> Callable[..., MCPResponse]:
+        @wraps(fn)
+        def wrapper(self: 'MCPProtocolHandler', request: MCPRequest, *args: Any, **kwargs: Any) -> MCPResponse:
+            try:
+                return fn(self, request, *args, **kwargs)
+            except ValueError as e:
+                # 业务逻辑错误（如无效的base64字符串）
+                return MCPResponse(
+                    id=request.id,
+                    error=MCPError(code=code, message=str(e))
+                )
+            except Exception as e:
+                # 其他未预期的错误
+                self.logger.error("%s: %s", log_context, e, exc_info=True)
+                return MCPResponse(
+                    id=request.id,
+                    error=self.error_handler.handle_exception(e)
+                )
+        return wrapper
+    return decorator
+
+
+# initialize和ping的响应数据是静态的，在模块加载时构建一次并在所有响应间共享。
+# 不使用MappingProxyType包装，因为响应序列化（json/orjson）不接受mappingproxy；
+# 调用方不应修改这些字典。
+_INITIALIZE_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "mcp-base64-server",
+        "version": "1.0.0"
+    }
+}
+
+_PING_RESULT: Dict[str, Any] = {}
+
+# 静态结果预先序列化，serialize_response输出响应时直接拼接JSON文本
+_INITIALIZE_RESULT_JSON = json.dumps(_INITIALIZE_RESULT)
+_PING_RESULT_JSON = json.dumps(_PING_RESULT)
+
+
+# 工具调用未提供arguments时共享的只读空参数
+_EMPTY_ARGUMENTS: Mapping[str, Any] = MappingProxyType({})
+
+# 区分参数缺失和参数值为None
+_MISSING = object()
+
+
+# 缓冲条目中无关键字参数时共享的空字典（flush时只做解包，不会被修改）
+_NO_KWARGS: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=256)
+def _request_metric_labels(method: str, has_params: bool, error_code: Optional[int]) -> Tuple[str, Dict[str, Any]]:
+    """
+    获取性能监控的操作名和标签
+    
+    标签只依赖方法名、是否带参数和错误码，按组合缓存后在请求间共享。
+    记录时会复制标签，因此共享的字典不会被修改。
+    
+    Args:
+        method: 请求方法名
+        has_params: 请求是否带参数
+        error_code: 错误代码，成功时为None
+        
+    Returns:
+        Tuple[str, Dict[str, Any]]: 操作名和标签字典
+    """
+    return f"mcp_{method}", {
+        'method': method,
+        'has_params': has_params,
+        'error_code': str(error_code) if error_code is not None else None
+    }
 
 
 class MCPProtocolHandler:
@@ -37,6 +214,25 @@ class MCPProtocolHandler:
     - 日志记录和调试支持
     """
     
+    __slots__ = (
+        "base64_service",
+        "error_handler",
+        "logger",
+        "tools",
+        "_dispatch",
+        "_tool_impls",
+        "_tools_list_cache",
+        "_tools_list_result",
+        "_tools_list_json",
+        "_tools_tuple",
+        "_tools_count",
+        "_metric_handles",
+        "_log_buffer",
+        "_flush_stop",
+        "_flush_thread",
+        "__weakref__",
+    )
+    
     def __init__(self, base64_service: Base64Service):
         """
         初始化MCP协议处理器
@@ -48,18 +244,43 @@ class MCPProtocolHandler:
         self.error_handler = ErrorHandler()
         self.logger = get_logger(__name__)
         
+        # 性能监控记录句柄：操作名 -> 句柄，避免每次记录都查找监控器中的字典
+        self._metric_handles: Dict[str, RequestMetricsHandle] = {}
+        
+        # 请求日志和性能记录缓冲区：请求路径只入队，由后台线程批量写出。
+        # 不设maxlen，避免缓冲区满时静默丢弃最早的记录
+        self._log_buffer: Deque[_LogRecord] = deque()
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=_flush_loop,
+            args=(weakref.ref(self), self._flush_stop),
+            name="mcp-log-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+        
         # 注册可用工具
         self.tools: Dict[str, ToolDefinition] = {}
         self._register_tools()
         
+        # 方法分发表：方法名 -> 处理函数，请求分发只需一次哈希查找。
+        # 键使用驻留字符串；json.loads得到的方法名不会被驻留，但哈希和内容相同时
+        # 字典查找仍然命中，与驻留字符串比较时先做指针比较
+        self._dispatch: Dict[str, Callable[[MCPRequest], MCPResponse]] = {
+            sys.intern(method): handler for method, handler in (
+                (MCPMethods.LIST_TOOLS, self._handle_list_tools),
+                (MCPMethods.CALL_TOOL, self._handle_call_tool),
+                (MCPMethods.INITIALIZE, self._handle_initialize),
+                (MCPMethods.PING, self._handle_ping)
+            )
+        }
+        
         self.logger.info("MCP Protocol Handler initialized", extra={
             'extra_data': {
                 'tools_count': len(self.tools),
                 'available_tools': list(self.tools.keys())
             }
         })
-        
-        self.logger.info(f"MCP Protocol Handler initialized with {len(self.tools)} tools")
     
     def _register_tools(self) -> None:
         """
@@ -69,12 +290,25 @@ class MCPProtocolHandler:
         每个工具都有唯一的名称和详细的输入参数模式定义。
         """
         # 注册base64编码工具
-        self.tools[BASE64_ENCODE_TOOL.name] = BASE64_ENCODE_TOOL
-        self.logger.debug(f"Registered tool: {BASE64_ENCODE_TOOL.name}")
+        self.tools[sys.intern(BASE64_ENCODE_TOOL.name)] = BASE64_ENCODE_TOOL
+        self.logger.debug("Registered tool: %s", BASE64_ENCODE_TOOL.name)
         
         # 注册base64解码工具
-        self.tools[BASE64_DECODE_TOOL.name] = BASE64_DECODE_TOOL
-        self.logger.debug(f"Registered tool: {BASE64_DECODE_TOOL.name}")
+        self.tools[sys.intern(BASE64_DECODE_TOOL.name)] = BASE64_DECODE_TOOL
+        self.logger.debug("Registered tool: %s", BASE64_DECODE_TOOL.name)
+        
+        # 工具名 -> (Base64Service方法名, 输入参数名, 操作名称)
+        self._tool_impls: Dict[str, Tuple[str, str, str]] = {
+            sys.intern(BASE64_ENCODE_TOOL.name): ("encode", "text", "encoding"),
+            sys.intern(BASE64_DECODE_TOOL.name): ("decode", "base64_string", "decoding")
+        }
+        
+        # 工具注册后不再变化，预先生成tools/list的响应数据
+        self._tools_list_cache = [tool.to_dict() for tool in self.tools.values()]
+        self._tools_list_result = {"tools": self._tools_list_cache}
+        self._tools_list_json = json.dumps(self._tools_list_result)
+        self._tools_tuple = tuple(self.tools.values())
+        self._tools_count = len(self._tools_tuple)
     
     def handle_request(self, request: MCPRequest) -> MCPResponse:
         """
@@ -92,86 +326,140 @@ class MCPProtocolHandler:
         Returns:
             MCPResponse: MCP响应对象，包含结果或错误信息
         """
-        start_time = time.time()
+        response = self._process_request(request, self._log_buffer)
+        if len(self._log_buffer) >= LOG_BUFFER_SIZE:
+            # 后台线程跟不上时由请求线程写出，限制缓冲区大小
+            self.flush()
+        return response
+    
+    def handle_requests(self, requests: List[MCPRequest]) -> List[MCPResponse]:
+        """
+        处理JSON-RPC批量请求
+        
+        逐个分发批量中的请求，日志和性能记录先收集到本地列表，
+        处理完成后一次性写入缓冲区；超过刷新阈值时立即写出。
+        
+        Args:
+            requests: MCP请求对象列表
+            
+        Returns:
+            List[MCPResponse]: 与请求顺序一致的响应列表
+        """
+        records: List[_LogRecord] = []
+        responses = [self._process_request(request, records) for request in requests]
+        self._log_buffer.extend(records)
+        if len(self._log_buffer) >= LOG_BUFFER_SIZE:
+            self.flush()
+        return responses
+    
+    def serialize_response(self, response: MCPResponse) -> str:
+        """
+        将响应序列化为JSON字符串
+        
+        tools/list、initialize和ping的结果是静态的，已预先序列化；
+        这些响应只需拼接响应id，不再对结果调用json.dumps。
+        输出与MCPResponse.to_json()完全一致。传输层通过
+        set_response_serializer()使用此方法。
+        
+        Args:
+            response: MCP响应对象
+            
+        Returns:
+            str: 响应的JSON文本
+        """
+        if response.error is None:
+            result = response.result
+            if result is self._tools_list_result:
+                result_json = self._tools_list_json
+            elif result is _PING_RESULT:
+                result_json = _PING_RESULT_JSON
+            elif result is _INITIALIZE_RESULT:
+                result_json = _INITIALIZE_RESULT_JSON
+            else:
+                return response.to_json()
+            return f'{{"jsonrpc": {json.dumps(response.jsonrpc)}, "id": {json.dumps(response.id)}, "result": {result_json}}}'
+        return response.to_json()
+    
+    def _process_request(self, request: MCPRequest, records: Union[Deque[_LogRecord], List[_LogRecord]]) -> MCPResponse:
+        """
+        处理单个MCP请求并记录日志和性能数据
+        
+        Args:
+            request: MCP请求对象
+            records: 接收日志和性能记录条目的缓冲区或批量本地列表
+            
+        Returns:
+            MCPResponse: MCP响应对象
+        """
+        start_ns = time.monotonic_ns()
         
         try:
             # 验证请求格式
             if not self._validate_request(request):
-                duration_ms = (time.time() - start_time) * 1000
-                log_request(
-                    __name__,
-                    request.method,
-                    status_code=400,
-                    duration_ms=duration_ms,
-                    extra_data={'request_id': request.id, 'error': 'Invalid request format'}
-                )
+                # 400状态以WARNING级别记录，未启用时跳过计时和日志数据构建
+                if self.logger.isEnabledFor(logging.WARNING):
+                    duration_ms = (time.monotonic_ns() - start_ns) / 1e6
+                    record = make_request_record(
+                        __name__, request.method, None, 400, duration_ms, None,
+                        {'request_id': request.id, 'error': 'Invalid request format'}
+                    )
+                    if record is not None:
+                        records.append((self.logger.handle, (record,), _NO_KWARGS))
                 return MCPResponse(
                     id=request.id,
-                    error=MCPError(
-                        code=MCPErrorCodes.INVALID_REQUEST,
-                        message="Invalid request format"
-                    )
+                    error=_ERR_INVALID_REQUEST
                 )
             
             # 根据方法分发请求
-            response = None
-            if request.method == MCPMethods.LIST_TOOLS:
-                response = self._handle_list_tools(request)
-            elif request.method == MCPMethods.CALL_TOOL:
-                response = self._handle_call_tool(request)
-            elif request.method == MCPMethods.INITIALIZE:
-                response = self._handle_initialize(request)
-            elif request.method == MCPMethods.PING:
-                response = self._handle_ping(request)
+            handler = self._dispatch.get(request.method)
+            if handler is not None:
+                response = handler(request)
             else:
                 response = MCPResponse(
                     id=request.id,
-                    error=MCPError(
-                        code=MCPErrorCodes.METHOD_NOT_FOUND,
-                        message=f"Method '{request.method}' not found"
-                    )
+                    error=_method_not_found_error(request.method)
                 )
             
-            # 记录请求处理结果
-            duration_ms = (time.time() - start_time) * 1000
-            status_code = 200 if response.error is None else 400
-            success = response.error is None
+            # 记录请求处理结果：日志和性能监控都未启用时跳过计时和记录
+            error = response.error
+            success = error is None
+            # 成功请求以INFO级别记录，失败请求以WARNING级别记录
+            log_enabled = self.logger.isEnabledFor(logging.INFO if success else logging.WARNING)
+            perf_enabled = performance_monitor.ENABLED
+            if not (log_enabled or perf_enabled):
+                return response
             
-            log_request(
-                __name__,
-                request.method,
-                status_code=status_code,
-                duration_ms=duration_ms,
-                extra_data={
-                    'request_id': request.id,
-                    'has_error': response.error is not None,
-                    'error_code': response.error.code if response.error else None
-                }
-            )
+            duration_ms = (time.monotonic_ns() - start_ns) / 1e6
+            error_code = None if success else error.code
             
-            # 记录性能监控数据
-            record_request(
-                f"mcp_{request.method}",
-                duration_ms,
-                success,
-                {
-                    'method': request.method,
-                    'has_params': bool(request.params),
-                    'error_code': str(response.error.code) if response.error else None
-                }
-            )
+            # 参数按位置传入，避免每个缓冲条目再分配关键字参数字典
+            if log_enabled:
+                record = make_request_record(
+                    __name__, request.method, None, 200 if success else 400, duration_ms, None,
+                    {'request_id': request.id, 'has_error': not success, 'error_code': error_code}
+                )
+                if record is not None:
+                    records.append((self.logger.handle, (record,), _NO_KWARGS))
+            
+            # 记录性能监控数据（操作名和标签按组合缓存，每个操作的记录句柄只获取一次）
+            if perf_enabled:
+                operation, labels = _request_metric_labels(request.method, bool(request.params), error_code)
+                metric_handle = self._metric_handles.get(operation)
+                if metric_handle is None:
+                    metric_handle = self._metric_handles[operation] = \
+                        get_performance_monitor().register_operation(operation)
+                # 记录请求发生时的时间戳，而不是刷新时的时间
+                records.append((metric_handle.add, (duration_ms, success, labels, time.time()), _NO_KWARGS))
             
             return response
                 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            log_request(
-                __name__,
-                request.method,
-                status_code=500,
-                duration_ms=duration_ms,
-                extra_data={'request_id': request.id, 'error': str(e)}
-            )
+            # 异常路径的请求日志和错误日志都立即记录，保持两者的先后顺序；
+            # 错误日志需要当前异常的堆栈信息
+            if self.logger.isEnabledFor(logging.ERROR):
+                duration_ms = (time.monotonic_ns() - start_ns) / 1e6
+                log_request(__name__, request.method, None, 500, duration_ms, None,
+                            {'request_id': request.id, 'error': str(e)})
             log_error(__name__, e, f"Error handling MCP request {request.method}", {
                 'request_id': request.id,
                 'method': request.method
@@ -193,19 +481,12 @@ class MCPProtocolHandler:
         Returns:
             bool: 请求是否有效
         """
-        # 检查JSON-RPC版本
-        if request.jsonrpc != "2.0":
-            return False
-        
-        # 检查方法名称
-        if not request.method or not isinstance(request.method, str):
-            return False
-        
-        # 检查参数类型
-        if request.params is not None and not isinstance(request.params, dict):
-            return False
-        
-        return True
+        # 检查JSON-RPC版本、方法名称和参数类型（JSON解析只产生内置类型，精确类型比较即可）
+        return (
+            request.jsonrpc == "2.0"
+            and type(request.method) is str and request.method != ""
+            and (request.params is None or type(request.params) is dict)
+        )
     
     def _handle_list_tools(self, request: MCPRequest) -> MCPResponse:
         """
@@ -222,21 +503,18 @@ class MCPProtocolHandler:
         """
         self.logger.debug("Handling list_tools request")
         
-        tools_list = [tool.to_dict() for tool in self.tools.values()]
-        
         return MCPResponse(
             id=request.id,
-            result={
-                "tools": tools_list
-            }
+            result=self._tools_list_result
         )
     
+    @mcp_errorwrap(MCPErrorCodes.INVALID_PARAMS, "Tool execution error")
     def _handle_call_tool(self, request: MCPRequest) -> MCPResponse:
         """
         处理工具调用请求
         
         根据请求参数调用指定的工具，并返回执行结果。
-        包含完整的参数验证和错误处理。
+        参数错误和执行异常由mcp_errorwrap转换为错误响应。
         
         Args:
             request: 工具调用请求
@@ -244,59 +522,40 @@ class MCPProtocolHandler:
         Returns:
             MCPResponse: 包含工具执行结果的响应
         """
-        self.logger.debug(f"Handling call_tool request: {request.params}")
-        
-        # 验证必需参数
-        if "name" not in request.params:
+        self.logger.debug("Handling call_tool request: %s", request.params)
+        
+        # 验证必需参数（单次查找，缺少参数时不再分配默认字典）。
+        # params由客户端提供，可能为null或非对象，先检查类型再调用get()
+        params = request.params
+        if type(params) is not dict:
+            raise ValueError("Invalid params: params must be an object")
+        tool_name = params.get("name")
+        if tool_name is None:
             return MCPResponse(
                 id=request.id,
-                error=MCPError(
-                    code=MCPErrorCodes.INVALID_PARAMS,
-                    message="Missing required parameter: name"
-                )
+                error=_ERR_MISSING_TOOL_NAME
             )
         
-        tool_name = request.params["name"]
-        arguments = request.params.get("arguments", {})
+        arguments = params.get("arguments") or _EMPTY_ARGUMENTS
         
         # 检查工具是否存在
-        if tool_name not in self.tools:
+        tool_impl = self._tool_impls.get(tool_name)
+        if tool_impl is None:
             return MCPResponse(
                 id=request.id,
-                error=MCPError(
-                    code=MCPErrorCodes.TOOL_NOT_FOUND,
-                    message=f"Tool '{tool_name}' not found"
-                )
+                error=_tool_not_found_error(tool_name)
             )
         
-        try:
-            # 调用工具
-            result = self._call_tool(tool_name, arguments)
-            
-            return MCPResponse(
-                id=request.id,
-                result={
-                    "content": result.to_dict()["content"],
-                    "isError": result.isError
-                }
-            )
-            
-        except ValueError as e:
-            # 业务逻辑错误（如无效的base64字符串）
-            return MCPResponse(
-                id=request.id,
-                error=MCPError(
-                    code=MCPErrorCodes.INVALID_PARAMS,
-                    message=str(e)
-                )
-            )
-        except Exception as e:
-            # 其他未预期的错误
-            self.logger.error(f"Tool execution error: {str(e)}", exc_info=True)
-            return MCPResponse(
-                id=request.id,
-                error=self.error_handler.handle_exception(e)
-            )
+        # 直接执行工具并构建响应内容，不经过ToolResult中间对象
+        content = self._run_codec(*tool_impl, arguments)
+        
+        return MCPResponse(
+            id=request.id,
+            result={
+                "content": [{"type": "text", "text": content, "mimeType": "text/plain"}],
+                "isError": False
+            }
+        )
     
     def _handle_initialize(self, request: MCPRequest) -> MCPResponse:
         """
@@ -314,16 +573,7 @@ class MCPProtocolHandler:
         
         return MCPResponse(
             id=request.id,
-            result={
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
-                },
-                "serverInfo": {
-                    "name": "mcp-base64-server",
-                    "version": "1.0.0"
-                }
-            }
+            result=_INITIALIZE_RESULT
         )
     
     def _handle_ping(self, request: MCPRequest) -> MCPResponse:
@@ -344,7 +594,7 @@ class MCPProtocolHandler:
         # According to MCP specification, ping response should be empty or minimal
         return MCPResponse(
             id=request.id,
-            result={}
+            result=_PING_RESULT
         )
     
     def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
@@ -366,117 +616,111 @@ class MCPProtocolHandler:
             ValueError: 参数验证失败或业务逻辑错误
             Exception: 其他执行错误
         """
-        self.logger.debug(f"Executing tool: {tool_name} with arguments: {arguments}")
+        self.logger.debug("Executing tool: %s with arguments: %s", tool_name, arguments)
         
-        if tool_name == "base64_encode":
-            return self._execute_base64_encode(arguments)
-        elif tool_name == "base64_decode":
-            return self._execute_base64_decode(arguments)
-        else:
+        tool_impl = self._tool_impls.get(tool_name)
+        if tool_impl is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+        
+        return ToolResult(
+            content=self._run_codec(*tool_impl, arguments),
+            isError=False,
+            mimeType="text/plain"
+        )
     
-    def _execute_base64_encode(self, arguments: Dict[str, Any]) -> ToolResult:
+    def _run_codec(self, operation: str, arg_name: str, action: str, arguments: Mapping[str, Any]) -> str:
         """
-        执行base64编码工具
+        执行base64编码或解码工具
         
-        将文本字符串编码为base64格式。包含参数验证和错误处理。
+        编码和解码工具共用的执行逻辑：参数验证并调用Base64Service。
         
         Args:
-            arguments: 工具参数，必须包含'text'字段
+            operation: Base64Service的方法名（'encode'或'decode'）
+            arg_name: 工具的输入参数名（'text'或'base64_string'）
+            action: 用于日志和错误信息的操作名称（'encoding'或'decoding'）
+            arguments: 工具参数
             
         Returns:
-            ToolResult: 编码结果
+            str: 编码或解码后的文本
             
         Raises:
-            ValueError: 参数无效或编码失败
+            ValueError: 参数无效或执行失败
         """
-        # 验证必需参数
-        if "text" not in arguments:
-            raise ValueError("Missing required parameter: text")
+        # arguments由客户端提供，可能不是对象
+        if not isinstance(arguments, Mapping):
+            raise ValueError("Invalid params: arguments must be an object")
         
-        text = arguments["text"]
+        # 验证必需参数
+        value = arguments.get(arg_name, _MISSING)
+        if value is _MISSING:
+            raise ValueError(f"Missing required parameter: {arg_name}")
         
         # 验证参数类型
-        if not isinstance(text, str):
-            raise ValueError("Parameter 'text' must be a string")
+        if not isinstance(value, str):
+            raise ValueError(f"Parameter '{arg_name}' must be a string")
         
         try:
-            # 执行编码
-            encoded_result = self.base64_service.encode(text)
-            
-            self.logger.debug(f"Successfully encoded {len(text)} characters to base64")
-            
-            return ToolResult(
-                content=encoded_result,
-                isError=False,
-                mimeType="text/plain"
-            )
-            
+            # 按调用时查找服务方法，便于替换或打桩
+            result = getattr(self.base64_service, operation)(value)
         except ValueError as e:
             # Base64Service抛出的验证错误
-            self.logger.warning(f"Base64 encoding failed: {str(e)}")
+            self.logger.warning("Base64 %s failed: %s", action, e)
             raise
         except Exception as e:
             # 其他未预期的错误
-            self.logger.error(f"Unexpected error in base64 encoding: {str(e)}")
-            raise ValueError(f"Encoding failed: {str(e)}")
-    
-    def _execute_base64_decode(self, arguments: Dict[str, Any]) -> ToolResult:
-        """
-        执行base64解码工具
+            self.logger.error("Unexpected error in base64 %s: %s", action, e)
+            raise ValueError(f"{action.capitalize()} failed: {str(e)}")
         
-        将base64字符串解码为文本。包含格式验证和错误处理。
+        self.logger.debug("Base64 %s succeeded: %d -> %d characters", action, len(value), len(result))
         
-        Args:
-            arguments: 工具参数，必须包含'base64_string'字段
-            
-        Returns:
-            ToolResult: 解码结果
-            
-        Raises:
-            ValueError: 参数无效或解码失败
+        return result
+    
+    def flush(self) -> None:
         """
-        # 验证必需参数
-        if "base64_string" not in arguments:
-            raise ValueError("Missing required parameter: base64_string")
-        
-        base64_string = arguments["base64_string"]
+        写出缓冲的请求日志和性能记录
         
-        # 验证参数类型
-        if not isinstance(base64_string, str):
-            raise ValueError("Parameter 'base64_string' must be a string")
+        由后台线程定期调用，也可在测试或关闭前手动调用。
+        """
+        buffer = self._log_buffer
+        while buffer:
+            try:
+                record_fn, args, kwargs = buffer.popleft()
+            except IndexError:
+                break
+            try:
+                record_fn(*args, **kwargs)
+            except Exception:
+                self.logger.error("Failed to flush buffered request record", exc_info=True)
+    
+    def close(self) -> None:
+        """
+        关闭协议处理器
         
+        停止后台刷新线程，写出剩余的缓冲记录。
+        """
+        self._flush_stop.set()
+        if self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=1.0)
+        self.flush()
+    
+    def __del__(self):
+        """处理器被回收时写出剩余的缓冲记录"""
         try:
-            # 执行解码
-            decoded_result = self.base64_service.decode(base64_string)
-            
-            self.logger.debug(f"Successfully decoded base64 string to {len(decoded_result)} characters")
-            
-            return ToolResult(
-                content=decoded_result,
-                isError=False,
-                mimeType="text/plain"
-            )
-            
-        except ValueError as e:
-            # Base64Service抛出的验证错误
-            self.logger.warning(f"Base64 decoding failed: {str(e)}")
-            raise
-        except Exception as e:
-            # 其他未预期的错误
-            self.logger.error(f"Unexpected error in base64 decoding: {str(e)}")
-            raise ValueError(f"Decoding failed: {str(e)}")
+            self.close()
+        except Exception:
+            pass
     
-    def get_available_tools(self) -> List[ToolDefinition]:
+    def get_available_tools(self) -> Tuple[ToolDefinition, ...]:
         """
         获取所有可用工具的定义
         
         返回当前注册的所有工具定义，用于调试和工具发现。
+        结果为注册时生成的不可变元组，需要列表的调用方可自行转换。
         
         Returns:
-            List[ToolDefinition]: 工具定义列表
+            Tuple[ToolDefinition, ...]: 工具定义元组
         """
-        return list(self.tools.values())
+        return self._tools_tuple
     
     def get_tool_count(self) -> int:
         """
@@ -485,4 +729,4 @@ class MCPProtocolHandler:
         Returns:
             int: 工具数量
         """
-        return len(self.tools)
\ No newline at end of file
+        return self._tools_count
\ No newline at end of file
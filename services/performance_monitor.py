@@ -6,17 +6,28 @@ request processing time tracking, error rate statistics, success rate monitoring
 and system resource usage tracking.
 """
 
+import logging
+import math
 import time
 import threading
 import psutil
-from typing import Dict, List, Any, Optional, Tuple
+from array import array
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from itertools import chain, takewhile
+from types import MappingProxyType
+
+from utils.compat import DATACLASS_SLOTS
 
 from .logging_service import get_logger
 
+# Number of recent-duration updates after which the running sum is recomputed
+RECENT_SUM_RESYNC_INTERVAL = 10000
+
 
 class MetricType(Enum):
     """Types of metrics that can be tracked."""
@@ -29,24 +40,104 @@ class MetricType(Enum):
     ACTIVE_CONNECTIONS = "active_connections"
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _iso_second(second: int) -> str:
+    """ISO format of a whole-second local timestamp."""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _isoformat_timestamp(timestamp: float) -> str:
+    """
+    Format a timestamp like datetime.fromtimestamp(timestamp).isoformat().
+    
+    The date/time part is cached per second, so exporting many points from
+    the same second formats the datetime only once.
+    """
+    second = math.floor(timestamp)
+    microsecond = round((timestamp - second) * 1e6)
+    if microsecond >= 1_000_000:
+        second += 1
+        microsecond -= 1_000_000
+    base = _iso_second(second)
+    return f"{base}.{microsecond:06d}" if microsecond else base
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MetricPoint:
-    """A single metric data point."""
+    """
+    A single metric data point.
+    
+    Points without labels (most system metrics) keep labels as None instead
+    of allocating an empty dict per point; to_dict() still exports {}.
+    """
     timestamp: float
     value: float
-    labels: Dict[str, str] = field(default_factory=dict)
+    labels: Optional[Dict[str, str]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metric point to dictionary."""
         return {
             'timestamp': self.timestamp,
             'value': self.value,
-            'labels': self.labels,
-            'datetime': datetime.fromtimestamp(self.timestamp).isoformat()
+            'labels': self.labels if self.labels is not None else {},
+            'datetime': _isoformat_timestamp(self.timestamp)
         }
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _operation_labels(operation: str) -> Dict[str, str]:
+    """Shared labels for a request recorded without extra labels."""
+    return {'operation': operation}
+
+
+class FloatRingBuffer:
+    """
+    Fixed-capacity ring buffer of floats.
+    
+    Values are stored unboxed in a preallocated array('d'), so appending does
+    not allocate a float object per sample, and the oldest value is
+    overwritten once the buffer is full. Iteration yields values oldest first.
+    """
+    
+    __slots__ = ('maxlen', '_buf', '_head', '_count')
+    
+    def __init__(self, maxlen: int, values: Iterable[float] = ()):
+        self.maxlen = maxlen
+        self._buf = array('d', bytes(8 * maxlen))
+        self._head = 0
+        self._count = 0
+        for value in values:
+            self.append(value)
+    
+    def append(self, value: float) -> float:
+        """
+        Append a value, overwriting the oldest one when the buffer is full.
+        
+        Returns:
+            The evicted value, or 0.0 if the buffer was not full
+        """
+        head = self._head
+        # Slots that were never written are zero, so this is 0.0 until full
+        evicted = self._buf[head]
+        self._buf[head] = value
+        self._head = head + 1 if head + 1 < self.maxlen else 0
+        if self._count < self.maxlen:
+            self._count += 1
+        return evicted
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[float]:
+        if self._count < self.maxlen:
+            return iter(self._buf[:self._count])
+        return chain(self._buf[self._head:], self._buf[:self._head])
+    
+    def __repr__(self) -> str:
+        return f"FloatRingBuffer({list(self)!r}, maxlen={self.maxlen})"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RequestMetrics:
     """Metrics for a specific request type."""
     total_requests: int = 0
@@ -55,21 +146,38 @@ class RequestMetrics:
     total_duration_ms: float = 0.0
     min_duration_ms: float = float('inf')
     max_duration_ms: float = 0.0
-    recent_durations: deque = field(default_factory=lambda: deque(maxlen=100))
+    recent_durations: FloatRingBuffer = field(default_factory=lambda: FloatRingBuffer(100))
+    # Running sum of recent_durations, kept in step with the ring buffer
+    _recent_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _recent_updates: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._recent_sum = sum(self.recent_durations)
     
     def add_request(self, duration_ms: float, success: bool) -> None:
         """Add a request measurement."""
         self.total_requests += 1
         self.total_duration_ms += duration_ms
-        self.recent_durations.append(duration_ms)
+        
+        evicted = self.recent_durations.append(duration_ms)
+        self._recent_updates += 1
+        if self._recent_updates >= RECENT_SUM_RESYNC_INTERVAL:
+            # Recompute periodically so floating point error cannot accumulate
+            self._recent_sum = sum(self.recent_durations)
+            self._recent_updates = 0
+        else:
+            self._recent_sum += duration_ms - evicted
         
         if success:
             self.successful_requests += 1
         else:
             self.failed_requests += 1
         
-        self.min_duration_ms = min(self.min_duration_ms, duration_ms)
-        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        # Plain comparisons avoid two builtin calls per request
+        if duration_ms < self.min_duration_ms:
+            self.min_duration_ms = duration_ms
+        if duration_ms > self.max_duration_ms:
+            self.max_duration_ms = duration_ms
     
     @property
     def success_rate(self) -> float:
@@ -97,7 +205,7 @@ class RequestMetrics:
         """Calculate average duration for recent requests."""
         if not self.recent_durations:
             return 0.0
-        return sum(self.recent_durations) / len(self.recent_durations)
+        return self._recent_sum / len(self.recent_durations)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary."""
@@ -114,6 +222,12 @@ class RequestMetrics:
         }
 
 
+# Metrics reported for an operation that has not recorded any request. Kept
+# read-only and copied on use, since callers may JSON-encode or modify the
+# returned dict (json.dumps does not accept a mappingproxy).
+_EMPTY_REQUEST_METRICS_DICT = MappingProxyType(RequestMetrics().to_dict())
+
+
 class PerformanceMonitor:
     """
     Performance monitoring service for tracking system and application metrics.
@@ -138,6 +252,17 @@ class PerformanceMonitor:
         # Metrics storage
         self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history_points))
         self._request_metrics: Dict[str, RequestMetrics] = defaultdict(RequestMetrics)
+        self._operation_handles: Dict[str, RequestMetricsHandle] = {}
+        
+        # Running totals across all operations, kept for the summary
+        self._total_requests = 0
+        self._total_successful = 0
+        self._total_failed = 0
+        
+        # Serialized per-operation metrics, rebuilt only after a request was
+        # recorded: (version, {operation: RequestMetrics.to_dict()})
+        self._request_metrics_version = 0
+        self._request_metrics_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
         
         # System monitoring
         self._system_monitoring_enabled = False
@@ -145,12 +270,19 @@ class PerformanceMonitor:
         self._system_monitor_interval = 5.0  # seconds
         self._shutdown_event = threading.Event()
         
-        # Active connections tracking
-        self._active_connections = 0
-        self._connection_lock = threading.Lock()
+        # Active connections tracking: one token per open connection. deque
+        # append/pop are single atomic operations, so no lock is needed and a
+        # pop on an empty deque cleanly refuses to go below zero.
+        self._connection_tokens: deque = deque()
+        
+        # Clock origin: timestamps are wall-clock seconds derived from the
+        # monotonic clock, so they never go backwards when the system clock is
+        # adjusted (history scans rely on points being in time order)
+        self._wall_origin = time.time()
+        self._mono_origin_ns = time.monotonic_ns()
         
         # Start time for uptime calculation
-        self._start_time = time.time()
+        self._start_ns = self._mono_origin_ns
         
         self.logger.info("Performance monitor initialized", extra={
             'extra_data': {
@@ -159,6 +291,10 @@ class PerformanceMonitor:
             }
         })
     
+    def _now(self) -> float:
+        """Current wall-clock time in seconds, advanced by the monotonic clock."""
+        return self._wall_origin + (time.monotonic_ns() - self._mono_origin_ns) / 1e9
+    
     def start_system_monitoring(self, interval: float = 5.0) -> None:
         """
         Start system resource monitoring.
@@ -199,26 +335,64 @@ class PerformanceMonitor:
     
     def _system_monitor_loop(self) -> None:
         """System monitoring loop running in background thread."""
+        # Bind the sensors and metric types once per thread rather than
+        # resolving the attributes on every tick
+        cpu_percent = psutil.cpu_percent
+        virtual_memory = psutil.virtual_memory
+        record_metric = self.record_metric
+        cpu_metric = MetricType.SYSTEM_CPU
+        memory_metric = MetricType.SYSTEM_MEMORY
+        connections_metric = MetricType.ACTIVE_CONNECTIONS
+        
+        # Ticks are scheduled on the monotonic clock so the time spent
+        # sampling does not stretch the period
+        interval = self._system_monitor_interval
+        next_tick = time.monotonic()
+        
         while self._system_monitoring_enabled and not self._shutdown_event.is_set():
             try:
-                # Collect CPU usage
-                cpu_percent = psutil.cpu_percent(interval=None)
-                self.record_metric(MetricType.SYSTEM_CPU, cpu_percent)
+                # CPU usage since the previous tick (non-blocking)
+                record_metric(cpu_metric, cpu_percent(interval=None))
                 
-                # Collect memory usage
-                memory = psutil.virtual_memory()
-                memory_percent = memory.percent
-                self.record_metric(MetricType.SYSTEM_MEMORY, memory_percent)
+                # Memory usage
+                record_metric(memory_metric, virtual_memory().percent)
                 
                 # Record active connections
-                with self._connection_lock:
-                    self.record_metric(MetricType.ACTIVE_CONNECTIONS, self._active_connections)
+                record_metric(connections_metric, self._active_connections)
                 
             except Exception as e:
                 self.logger.error(f"Error in system monitoring: {e}")
             
-            # Wait for next interval
-            self._shutdown_event.wait(self._system_monitor_interval)
+            # Wait for the next tick; ticks missed while falling behind are
+            # skipped rather than sampled back to back
+            now = time.monotonic()
+            next_tick += interval
+            if next_tick <= now and interval > 0:
+                next_tick += ((now - next_tick) // interval + 1) * interval
+            self._shutdown_event.wait(next_tick - now)
+    
+    def _metric_points(self, metric_name: str) -> deque:
+        """
+        Get the history deque of a metric, creating it on first use.
+        
+        Request threads and the system monitor thread record concurrently.
+        The defaultdict factory runs Python code between the lookup and the
+        insert, so two first writers could each install a deque and one of
+        them would lose its point. setdefault() inserts in a single dict
+        operation; every later append is a plain deque append, which needs
+        no lock.
+        """
+        points = self._metrics.get(metric_name)
+        if points is None:
+            points = self._metrics.setdefault(metric_name, deque(maxlen=self.max_history_points))
+        return points
+    
+    def _operation_metrics(self, operation: str) -> RequestMetrics:
+        """Get the RequestMetrics of an operation, creating it on first use (see _metric_points)."""
+        request_metrics = self._request_metrics.get(operation)
+        if request_metrics is None:
+            request_metrics = self._request_metrics.setdefault(operation, RequestMetrics())
+        return request_metrics
     
     def record_metric(self, metric_type: MetricType, value: float, labels: Optional[Dict[str, str]] = None) -> None:
         """
@@ -229,14 +403,14 @@ class PerformanceMonitor:
             value: Metric value
             labels: Optional labels for the metric
         """
-        timestamp = time.time()
+        timestamp = self._now()
         metric_point = MetricPoint(
             timestamp=timestamp,
             value=value,
-            labels=labels or {}
+            labels=labels or None
         )
         
-        self._metrics[metric_type.value].append(metric_point)
+        self._metric_points(metric_type.value).append(metric_point)
     
     def record_request(self, operation: str, duration_ms: float, success: bool, 
                       labels: Optional[Dict[str, str]] = None) -> None:
@@ -249,40 +423,78 @@ class PerformanceMonitor:
             success: Whether the request was successful
             labels: Optional labels for categorization
         """
-        # Update request-specific metrics
-        self._request_metrics[operation].add_request(duration_ms, success)
+        self._record_request_into(
+            self._operation_metrics(operation),
+            self._metric_points(MetricType.REQUEST_DURATION.value),
+            operation, duration_ms, success, labels
+        )
+    
+    def register_operation(self, operation: str) -> 'RequestMetricsHandle':
+        """
+        Get a pre-resolved recorder for an operation.
         
-        # Record general metrics
-        self.record_metric(MetricType.REQUEST_DURATION, duration_ms, 
-                          {**(labels or {}), 'operation': operation})
-        self.record_metric(MetricType.REQUEST_COUNT, 1, 
-                          {**(labels or {}), 'operation': operation})
+        Callers that record the same operation on every request can keep the
+        returned handle and call its add() method instead of record_request().
         
+        Args:
+            operation: Operation name
+            
+        Returns:
+            Handle for recording requests of the operation
+        """
+        handle = self._operation_handles.get(operation)
+        if handle is None:
+            handle = self._operation_handles[operation] = RequestMetricsHandle(self, operation)
+        return handle
+    
+    def _record_request_into(self, request_metrics: RequestMetrics, durations: deque, operation: str,
+                             duration_ms: float, success: bool,
+                             labels: Optional[Dict[str, str]],
+                             timestamp: Optional[float] = None) -> None:
+        """Record a request into already resolved metric storage."""
+        # Update request-specific metrics (request, success and error counts
+        # are kept here rather than as separate count-of-1 metric points)
+        request_metrics.add_request(duration_ms, success)
+        self._total_requests += 1
         if success:
-            self.record_metric(MetricType.SUCCESS_COUNT, 1, 
-                              {**(labels or {}), 'operation': operation})
+            self._total_successful += 1
         else:
-            self.record_metric(MetricType.ERROR_COUNT, 1, 
-                              {**(labels or {}), 'operation': operation})
-        
-        self.logger.debug(f"Recorded request metric", extra={
-            'extra_data': {
-                'operation': operation,
-                'duration_ms': duration_ms,
-                'success': success,
-                'labels': labels
-            }
-        })
+            self._total_failed += 1
+        self._request_metrics_version += 1
+        
+        # Record request duration; labels are merged once per request
+        durations.append(MetricPoint(
+            timestamp=self._now() if timestamp is None else timestamp,
+            value=duration_ms,
+            labels={**labels, 'operation': operation} if labels else _operation_labels(operation)
+        ))
+        
+        # Runs on every request: skip building the extra dict unless DEBUG is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Recorded request metric", extra={
+                'extra_data': {
+                    'operation': operation,
+                    'duration_ms': duration_ms,
+                    'success': success,
+                    'labels': labels
+                }
+            })
+    
+    @property
+    def _active_connections(self) -> int:
+        """Current number of active connections."""
+        return len(self._connection_tokens)
     
     def increment_active_connections(self) -> None:
         """Increment active connections counter."""
-        with self._connection_lock:
-            self._active_connections += 1
+        self._connection_tokens.append(None)
     
     def decrement_active_connections(self) -> None:
-        """Decrement active connections counter."""
-        with self._connection_lock:
-            self._active_connections = max(0, self._active_connections - 1)
+        """Decrement active connections counter (never below zero)."""
+        try:
+            self._connection_tokens.pop()
+        except IndexError:
+            pass
     
     def get_request_metrics(self, operation: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -292,18 +504,66 @@ class PerformanceMonitor:
             operation: Specific operation name, or None for all operations
             
         Returns:
-            Dictionary containing request metrics
+            Dictionary containing request metrics. For all operations the
+            per-operation dictionaries are cached between calls and must not
+            be modified.
         """
         if operation:
             if operation in self._request_metrics:
                 return {operation: self._request_metrics[operation].to_dict()}
             else:
-                return {operation: RequestMetrics().to_dict()}
+                return {operation: dict(_EMPTY_REQUEST_METRICS_DICT)}
+        
+        # Reuse the serialized metrics until another request is recorded. The
+        # version is read before serializing, so a request recorded meanwhile
+        # invalidates the entry.
+        version = self._request_metrics_version
+        cached = self._request_metrics_cache
+        if cached is None or cached[0] != version:
+            cached = self._request_metrics_cache = (version, {
+                op: metrics.to_dict() 
+                for op, metrics in list(self._request_metrics.items())
+            })
+        return dict(cached[1])
+    
+    def _points_since(self, metric_name: str, cutoff_time: float) -> List[MetricPoint]:
+        """
+        Get points of a metric recorded at or after cutoff_time, oldest first.
         
-        return {
-            op: metrics.to_dict() 
-            for op, metrics in self._request_metrics.items()
-        }
+        Points are appended in time order, so the scan walks back from the
+        newest point and stops at the first one older than the cutoff instead
+        of filtering the whole history. When even the oldest point is inside
+        the window the history is copied without comparing each point.
+        
+        Args:
+            metric_name: Metric name
+            cutoff_time: Earliest timestamp to include
+            
+        Returns:
+            List of metric points
+        """
+        points = self._metrics.get(metric_name)
+        if not points:
+            return []
+        if points[0].timestamp >= cutoff_time:
+            return list(points)
+        
+        recent = list(takewhile(lambda point: point.timestamp >= cutoff_time, reversed(points)))
+        recent.reverse()
+        return recent
+    
+    def _values_since(self, metric_name: str, cutoff_time: float) -> List[float]:
+        """
+        Get values of a metric recorded at or after cutoff_time, oldest first.
+        
+        Args:
+            metric_name: Metric name
+            cutoff_time: Earliest timestamp to include
+            
+        Returns:
+            List of metric values
+        """
+        return [point.value for point in self._points_since(metric_name, cutoff_time)]
     
     def get_system_metrics(self, time_range_minutes: int = 10) -> Dict[str, Any]:
         """
@@ -315,21 +575,17 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing system metrics
         """
-        cutoff_time = time.time() - (time_range_minutes * 60)
+        cutoff_time = self._now() - (time_range_minutes * 60)
         
         result = {}
         
         for metric_type in [MetricType.SYSTEM_CPU, MetricType.SYSTEM_MEMORY, MetricType.ACTIVE_CONNECTIONS]:
             metric_name = metric_type.value
-            points = [
-                point for point in self._metrics[metric_name]
-                if point.timestamp >= cutoff_time
-            ]
+            values = self._values_since(metric_name, cutoff_time)
             
-            if points:
-                values = [point.value for point in points]
+            if values:
                 result[metric_name] = {
-                    'current': values[-1] if values else 0,
+                    'current': values[-1],
                     'average': sum(values) / len(values),
                     'min': min(values),
                     'max': max(values),
@@ -355,12 +611,12 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing performance summary
         """
-        uptime_seconds = time.time() - self._start_time
+        uptime_seconds = (time.monotonic_ns() - self._start_ns) / 1e9
         
         # Calculate overall statistics
-        total_requests = sum(metrics.total_requests for metrics in self._request_metrics.values())
-        total_successful = sum(metrics.successful_requests for metrics in self._request_metrics.values())
-        total_failed = sum(metrics.failed_requests for metrics in self._request_metrics.values())
+        total_requests = self._total_requests
+        total_successful = self._total_successful
+        total_failed = self._total_failed
         
         overall_success_rate = (total_successful / total_requests * 100) if total_requests > 0 else 0
         overall_error_rate = (total_failed / total_requests * 100) if total_requests > 0 else 0
@@ -383,17 +639,20 @@ class PerformanceMonitor:
             'timestamp': datetime.now().isoformat()
         }
     
-    def get_metrics_for_export(self, time_range_minutes: int = 60) -> Dict[str, Any]:
+    def get_metrics_for_export(self, time_range_minutes: int = 60,
+                               include_data_points: bool = True) -> Dict[str, Any]:
         """
         Get metrics formatted for external monitoring systems.
         
         Args:
             time_range_minutes: Time range in minutes
+            include_data_points: Whether to include per-point data; when False
+                only the summary of each metric is built
             
         Returns:
             Dictionary containing metrics in export format
         """
-        cutoff_time = time.time() - (time_range_minutes * 60)
+        cutoff_time = self._now() - (time_range_minutes * 60)
         
         export_data = {
             'timestamp': datetime.now().isoformat(),
@@ -401,24 +660,34 @@ class PerformanceMonitor:
             'metrics': {}
         }
         
+        # Request counts come from the per-operation request metrics
+        export_data['request_counts'] = {
+            op: {
+                MetricType.REQUEST_COUNT.value: metrics.total_requests,
+                MetricType.SUCCESS_COUNT.value: metrics.successful_requests,
+                MetricType.ERROR_COUNT.value: metrics.failed_requests
+            }
+            for op, metrics in self._request_metrics.items()
+        }
+        
         # Export all metric types
-        for metric_name, points in self._metrics.items():
-            recent_points = [
-                point.to_dict() for point in points
-                if point.timestamp >= cutoff_time
-            ]
+        for metric_name in list(self._metrics):
+            recent_points = self._points_since(metric_name, cutoff_time)
             
             if recent_points:
-                export_data['metrics'][metric_name] = {
-                    'data_points': recent_points,
-                    'summary': {
-                        'count': len(recent_points),
-                        'latest_value': recent_points[-1]['value'],
-                        'average': sum(p['value'] for p in recent_points) / len(recent_points),
-                        'min': min(p['value'] for p in recent_points),
-                        'max': max(p['value'] for p in recent_points)
-                    }
+                # Summarise a plain list of floats instead of re-reading point dicts
+                values = [point.value for point in recent_points]
+                metric_data: Dict[str, Any] = {}
+                if include_data_points:
+                    metric_data['data_points'] = [point.to_dict() for point in recent_points]
+                metric_data['summary'] = {
+                    'count': len(values),
+                    'latest_value': values[-1],
+                    'average': sum(values) / len(values),
+                    'min': min(values),
+                    'max': max(values)
                 }
+                export_data['metrics'][metric_name] = metric_data
         
         return export_data
     
@@ -426,7 +695,13 @@ class PerformanceMonitor:
         """Reset all metrics (useful for testing)."""
         self._metrics.clear()
         self._request_metrics.clear()
-        self._start_time = time.time()
+        for handle in self._operation_handles.values():
+            handle._invalidate()
+        self._total_requests = 0
+        self._total_successful = 0
+        self._total_failed = 0
+        self._request_metrics_version += 1
+        self._start_ns = time.monotonic_ns()
         
         self.logger.info("Performance metrics reset")
     
@@ -436,8 +711,72 @@ class PerformanceMonitor:
         self.logger.info("Performance monitor shutdown")
 
 
-# Global performance monitor instance
+class RequestMetricsHandle:
+    """
+    Pre-resolved recorder for a single operation.
+    
+    Obtained from PerformanceMonitor.register_operation(). The handle keeps
+    direct references to the operation's RequestMetrics and the request
+    duration history, so add() skips the per-call dictionary lookups of
+    record_request(). The references are re-resolved lazily after
+    reset_metrics().
+    """
+    
+    __slots__ = ('operation', '_monitor', '_request_metrics', '_durations')
+    
+    def __init__(self, monitor: PerformanceMonitor, operation: str):
+        self.operation = operation
+        self._monitor = monitor
+        self._request_metrics: Optional[RequestMetrics] = None
+        self._durations: Optional[deque] = None
+    
+    def add(self, duration_ms: float, success: bool, labels: Optional[Dict[str, str]] = None,
+            timestamp: Optional[float] = None) -> None:
+        """
+        Record a request of this operation.
+        
+        Args:
+            duration_ms: Request duration in milliseconds
+            success: Whether the request was successful
+            labels: Optional labels for categorization
+            timestamp: Wall-clock time of the request; defaults to now. Pass it
+                when the request is recorded later than it happened.
+        """
+        request_metrics = self._request_metrics
+        if request_metrics is None:
+            monitor = self._monitor
+            request_metrics = self._request_metrics = monitor._operation_metrics(self.operation)
+            self._durations = monitor._metric_points(MetricType.REQUEST_DURATION.value)
+        self._monitor._record_request_into(
+            request_metrics, self._durations, self.operation, duration_ms, success, labels, timestamp
+        )
+    
+    def _invalidate(self) -> None:
+        """Drop resolved references after the monitor's storage was reset."""
+        self._request_metrics = None
+        self._durations = None
+
+
+# Global performance monitor instance; the lock is only taken while it is
+# being created
 _performance_monitor: Optional[PerformanceMonitor] = None
+_performance_monitor_lock = threading.Lock()
+
+# Whether request metrics are recorded. record_request() is a no-op while this
+# is off; callers on the hot path may also check it to skip the call entirely.
+# Set from the performance.monitoring_enabled configuration via set_enabled().
+ENABLED: bool = True
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Enable or disable request metric recording.
+    
+    Args:
+        enabled: Whether request metrics should be recorded
+    """
+    global ENABLED
+    ENABLED = enabled
 
 
 def get_performance_monitor() -> PerformanceMonitor:
@@ -448,9 +787,13 @@ def get_performance_monitor() -> PerformanceMonitor:
         PerformanceMonitor instance
     """
     global _performance_monitor
-    if _performance_monitor is None:
-        _performance_monitor = PerformanceMonitor()
-    return _performance_monitor
+    monitor = _performance_monitor
+    if monitor is None:
+        with _performance_monitor_lock:
+            monitor = _performance_monitor
+            if monitor is None:
+                monitor = _performance_monitor = PerformanceMonitor()
+    return monitor
 
 
 def record_request(operation: str, duration_ms: float, success: bool, 
@@ -464,6 +807,8 @@ def record_request(operation: str, duration_ms: float, success: bool,
         success: Whether the request was successful
         labels: Optional labels for categorization
     """
+    if not ENABLED:
+        return
     monitor = get_performance_monitor()
     monitor.record_request(operation, duration_ms, success, labels)
 
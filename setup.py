@@ -50,6 +50,7 @@ dev_requirements = [
     "pytest>=7.4.0",
     "pytest-cov>=4.1.0",
     "pytest-asyncio>=0.21.0",
+    "pytest-xdist>=3.3.0",
     "black>=23.0.0",
     "flake8>=6.0.0",
     "mypy>=1.5.0",
@@ -91,6 +92,7 @@ setup(
     extras_require={
         "dev": dev_requirements,
         "monitoring": ["prometheus-client>=0.17.0"],
+        "speedups": ["orjson>=3.8.0", "fastjsonschema>=2.16.0"],
         "redis": ["redis>=4.5.0"],
         "ssl": ["cryptography>=41.0.0"],
     },
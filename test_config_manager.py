@@ -2,22 +2,35 @@
 Tests for configuration management system.
 """
 
+import dataclasses
 import os
 import tempfile
 import pytest
-import yaml
 from unittest.mock import patch
 
 from config import ConfigManager, Config, ConfigValidator, ConfigValidationError
 from config.config_models import ServerConfig, TransportConfig, HttpServerConfig
+from config._yaml import dump as yaml_dump, load as yaml_load
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration shared by tests that only read it."""
+    return Config.get_default()
+
+
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory):
+    """Temporary directory shared by tests that never write a config file."""
+    return tmp_path_factory.mktemp("config")
 
 
 class TestConfigModels:
     """Test configuration data models."""
     
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default configuration creation."""
-        config = Config.get_default()
+        config = default_config
         
         assert config.server.name == "mcp-base64-server"
         assert config.server.version == "1.0.0"
@@ -29,15 +42,16 @@ class TestConfigModels:
         assert config.logging.level == "INFO"
         assert config.debug.enabled is False
     
-    def test_config_to_dict(self):
+    def test_config_to_dict(self, default_config):
         """Test configuration to dictionary conversion."""
-        config = Config.get_default()
-        config_dict = config.to_dict()
+        config_dict = default_config.to_dict()
         
         assert isinstance(config_dict, dict)
         assert config_dict['server']['name'] == "mcp-base64-server"
         assert config_dict['transport']['type'] == "stdio"
         assert config_dict['transport']['http']['port'] == 3000
+        # Every dataclass field is serialized
+        assert config_dict == dataclasses.asdict(default_config)
     
     def test_config_from_dict(self):
         """Test configuration creation from dictionary."""
@@ -56,6 +70,9 @@ class TestConfigModels:
             'http_server': {
                 'enabled': True,
                 'port': 9000
+            },
+            'performance': {
+                'monitoring_enabled': False
             }
         }
         
@@ -68,16 +85,16 @@ class TestConfigModels:
         assert config.transport.http.port == 4000
         assert config.http_server.enabled is True
         assert config.http_server.port == 9000
+        assert config.performance.monitoring_enabled is False
 
 
 class TestConfigValidator:
     """Test configuration validator."""
     
-    def test_valid_config(self):
+    def test_valid_config(self, default_config):
         """Test validation of valid configuration."""
-        config = Config.get_default()
         # Should not raise any exception
-        ConfigValidator.validate(config)
+        ConfigValidator.validate(default_config)
     
     def test_invalid_transport_type(self):
         """Test validation with invalid transport type."""
@@ -127,16 +144,14 @@ class TestConfigValidator:
 class TestConfigManager:
     """Test configuration manager."""
     
-    def test_load_default_config(self):
+    def test_load_default_config(self, config_dir):
         """Test loading default configuration when no file exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = os.path.join(temp_dir, "nonexistent.yaml")
-            manager = ConfigManager(config_file)
-            
-            config = manager.load_config()
-            
-            assert config.server.name == "mcp-base64-server"
-            assert config.transport.type == "stdio"
+        manager = ConfigManager(str(config_dir / "nonexistent.yaml"))
+        
+        config = manager.load_config()
+        
+        assert config.server.name == "mcp-base64-server"
+        assert config.transport.type == "stdio"
     
     def test_load_config_from_file(self):
         """Test loading configuration from YAML file."""
@@ -154,7 +169,7 @@ class TestConfigManager:
         }
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
+            yaml_dump(config_data, f)
             config_file = f.name
         
         try:
@@ -168,26 +183,41 @@ class TestConfigManager:
         finally:
             os.unlink(config_file)
     
-    def test_env_overrides(self):
+    def test_env_overrides(self, config_dir):
         """Test environment variable overrides."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = os.path.join(temp_dir, "test.yaml")
-            manager = ConfigManager(config_file)
+        manager = ConfigManager(str(config_dir / "test.yaml"))
+        
+        with patch.dict(os.environ, {
+            'MCP_BASE64_SERVER_NAME': 'env-server',
+            'MCP_BASE64_TRANSPORT_TYPE': 'http',
+            'MCP_BASE64_TRANSPORT_HTTP_PORT': '5000',
+            'MCP_BASE64_HTTP_SERVER_ENABLED': 'true',
+            'MCP_BASE64_LOG_LEVEL': 'DEBUG'
+        }):
+            config = manager.load_config()
             
-            with patch.dict(os.environ, {
-                'MCP_BASE64_SERVER_NAME': 'env-server',
-                'MCP_BASE64_TRANSPORT_TYPE': 'http',
-                'MCP_BASE64_TRANSPORT_HTTP_PORT': '5000',
-                'MCP_BASE64_HTTP_SERVER_ENABLED': 'true',
-                'MCP_BASE64_LOG_LEVEL': 'DEBUG'
-            }):
-                config = manager.load_config()
-                
-                assert config.server.name == 'env-server'
-                assert config.transport.type == 'http'
-                assert config.transport.http.port == 5000
-                assert config.http_server.enabled is True
-                assert config.logging.level == 'DEBUG'
+            assert config.server.name == 'env-server'
+            assert config.transport.type == 'http'
+            assert config.transport.http.port == 5000
+            assert config.http_server.enabled is True
+            assert config.logging.level == 'DEBUG'
+    
+    def test_env_overrides_invalid_values(self, config_dir):
+        """Test invalid port overrides are ignored and booleans are parsed."""
+        manager = ConfigManager(str(config_dir / "test.yaml"))
+        
+        with patch.dict(os.environ, {
+            'MCP_BASE64_HTTP_SERVER_PORT': 'not-a-port',
+            'MCP_BASE64_LOG_COLORS': 'off',
+            'MCP_BASE64_DEBUG_INSPECTOR_PORT': '9100',
+            'MCP_BASE64_PERFORMANCE_MONITORING': 'false'
+        }):
+            config = manager.load_config()
+        
+        assert config.http_server.port == 8080
+        assert config.logging.use_colors is False
+        assert config.debug.inspector_port == 9100
+        assert config.performance.monitoring_enabled is False
     
     def test_save_config(self):
         """Test saving configuration to file."""
@@ -203,9 +233,11 @@ class TestConfigManager:
             
             # Load and verify
             with open(config_file, 'r') as f:
-                saved_data = yaml.safe_load(f)
+                saved_data = yaml_load(f)
             
             assert saved_data['server']['name'] == 'saved-server'
+            # Sections keep the Config field order
+            assert list(saved_data) == ['server', 'transport', 'http_server', 'logging', 'debug', 'performance']
         finally:
             os.unlink(config_file)
     
@@ -216,38 +248,35 @@ class TestConfigManager:
         with pytest.raises(RuntimeError, match="Configuration has not been loaded"):
             manager.get_config()
     
-    def test_config_summary(self):
+    def test_config_summary(self, config_dir):
         """Test configuration summary."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = os.path.join(temp_dir, "test.yaml")
-            manager = ConfigManager(config_file)
-            
-            # Before loading
-            summary = manager.get_config_summary()
-            assert summary['status'] == 'not_loaded'
-            
-            # After loading
-            manager.load_config()
-            summary = manager.get_config_summary()
-            assert summary['status'] == 'loaded'
-            assert summary['server_name'] == 'mcp-base64-server'
-            assert summary['transport_type'] == 'stdio'
-    
-    def test_create_default_config_file(self):
+        manager = ConfigManager(str(config_dir / "test.yaml"))
+        
+        # Before loading
+        summary = manager.get_config_summary()
+        assert summary['status'] == 'not_loaded'
+        
+        # After loading
+        manager.load_config()
+        summary = manager.get_config_summary()
+        assert summary['status'] == 'loaded'
+        assert summary['server_name'] == 'mcp-base64-server'
+        assert summary['transport_type'] == 'stdio'
+    
+    def test_create_default_config_file(self, tmp_path):
         """Test creating default configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = os.path.join(temp_dir, "default.yaml")
-            
-            ConfigManager.create_default_config_file(config_file)
-            
-            assert os.path.exists(config_file)
-            
-            # Verify content
-            with open(config_file, 'r') as f:
-                data = yaml.safe_load(f)
-            
-            assert data['server']['name'] == 'mcp-base64-server'
-            assert data['transport']['type'] == 'stdio'
+        config_file = tmp_path / "default.yaml"
+        
+        ConfigManager.create_default_config_file(str(config_file))
+        
+        assert config_file.exists()
+        
+        # Verify content
+        with open(config_file, 'r') as f:
+            data = yaml_load(f)
+        
+        assert data['server']['name'] == 'mcp-base64-server'
+        assert data['transport']['type'] == 'stdio'
 
 
 if __name__ == "__main__":
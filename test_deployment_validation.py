@@ -5,14 +5,13 @@ Deployment Validation Test Suite for MCP Base64 Server
 This test suite validates core functionality for deployment readiness.
 """
 
+import importlib.util
+import io
 import sys
 import os
-import time
-import requests
-import json
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import subprocess
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -22,12 +21,22 @@ from services.mcp_protocol_handler import MCPProtocolHandler
 from servers.http_server import HTTPServer
 from config import ConfigManager
 
+# Shared by the service and handler checks, which only read from them;
+# built once instead of per check
+_SERVICE = Base64Service()
+_HANDLER = MCPProtocolHandler(_SERVICE)
+
+
+def _result(response):
+    """Return the result payload of a handler response, or None on error"""
+    return getattr(response, 'result', None)
+
 
 def test_base64_service():
     """Test Base64Service core functionality"""
     print("Testing Base64Service...")
     
-    service = Base64Service()
+    service = _SERVICE
     
     # Test basic encoding/decoding
     test_text = "Hello, World!"
@@ -51,8 +60,7 @@ def test_mcp_protocol_handler():
     """Test MCP Protocol Handler"""
     print("Testing MCP Protocol Handler...")
     
-    service = Base64Service()
-    handler = MCPProtocolHandler(service)
+    handler = _HANDLER
     
     # Test tool listing
     tools = handler.get_available_tools()
@@ -77,12 +85,9 @@ def test_mcp_protocol_handler():
         }
     )
     
-    response = handler.handle_request(encode_request)
-    response_dict = response.__dict__ if hasattr(response, '__dict__') else response
-    assert "result" in response_dict or hasattr(response, 'result'), "Encode request should succeed"
-    
-    if hasattr(response, 'result') and response.result:
-        assert response.result["content"][0]["text"] == "SGVsbG8=", "Incorrect encoding result"
+    result = _result(handler.handle_request(encode_request))
+    assert result is not None, "Encode request should succeed"
+    assert result["content"][0]["text"] == "SGVsbG8=", "Incorrect encoding result"
     print("✓ Encode tool works")
     
     # Test decode tool
@@ -96,12 +101,9 @@ def test_mcp_protocol_handler():
         }
     )
     
-    response = handler.handle_request(decode_request)
-    response_dict = response.__dict__ if hasattr(response, '__dict__') else response
-    assert "result" in response_dict or hasattr(response, 'result'), "Decode request should succeed"
-    
-    if hasattr(response, 'result') and response.result:
-        assert response.result["content"][0]["text"] == "Hello", "Incorrect decoding result"
+    result = _result(handler.handle_request(decode_request))
+    assert result is not None, "Decode request should succeed"
+    assert result["content"][0]["text"] == "Hello", "Incorrect decoding result"
     print("✓ Decode tool works")
     
     return True
@@ -111,8 +113,11 @@ def test_http_server():
     """Test HTTP Server functionality"""
     print("Testing HTTP Server...")
     
-    # Find a free port
+    # Only this check needs the network modules (requests is slow to import)
     import socket
+    import requests
+    
+    # Find a free port
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.bind(('', 0))
         s.listen(1)
@@ -120,25 +125,25 @@ def test_http_server():
     
     server = HTTPServer(host="localhost", port=port)
     
-    # Start server in a thread
-    server_thread = threading.Thread(target=server.start, daemon=True)
-    server_thread.start()
-    
-    # Wait for server to start
-    time.sleep(2)
+    # start() binds and listens before returning and serves from its own
+    # daemon thread, so requests can be sent right away
+    server.start()
     
     base_url = f"http://localhost:{port}"
     
+    # One session keeps the connection alive across the endpoint checks
+    session = requests.Session()
+    
     try:
         # Test health endpoint
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = session.get(f"{base_url}/health", timeout=5)
         assert response.status_code == 200, f"Health check failed: {response.status_code}"
         assert response.json()["status"] == "healthy", "Health status not healthy"
         print("✓ Health endpoint works")
         
         # Test encode endpoint
         encode_data = {"text": "Hello"}
-        response = requests.post(f"{base_url}/encode", json=encode_data, timeout=5)
+        response = session.post(f"{base_url}/encode", json=encode_data, timeout=5)
         assert response.status_code == 200, f"Encode failed: {response.status_code}"
         result = response.json()
         assert result["success"] is True, "Encode should succeed"
@@ -147,7 +152,7 @@ def test_http_server():
         
         # Test decode endpoint
         decode_data = {"base64_string": "SGVsbG8="}
-        response = requests.post(f"{base_url}/decode", json=decode_data, timeout=5)
+        response = session.post(f"{base_url}/decode", json=decode_data, timeout=5)
         assert response.status_code == 200, f"Decode failed: {response.status_code}"
         result = response.json()
         assert result["success"] is True, "Decode should succeed"
@@ -155,11 +160,12 @@ def test_http_server():
         print("✓ Decode endpoint works")
         
         # Test static file serving
-        response = requests.get(f"{base_url}/", timeout=5)
+        response = session.get(f"{base_url}/", timeout=5)
         assert response.status_code == 200, f"Static file serving failed: {response.status_code}"
         print("✓ Static file serving works")
         
     finally:
+        session.close()
         server.stop()
     
     return True
@@ -191,11 +197,11 @@ def test_requirements_installation():
         "flask_cors"
     ]
     
+    # find_spec only locates the package; importing flask just to check it is slow
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package} is available")
-        except ImportError:
+        else:
             print(f"❌ {package} is missing")
             return False
     
@@ -223,8 +229,19 @@ def test_file_structure():
         "static/app.js"
     ]
     
+    # List each directory once instead of stat-ing every file
+    entries_by_dir = {}
     for file_path in required_files:
-        if Path(file_path).exists():
+        directory, name = os.path.split(file_path)
+        directory = directory or "."
+        if directory not in entries_by_dir:
+            try:
+                with os.scandir(directory) as entries:
+                    entries_by_dir[directory] = {entry.name for entry in entries}
+            except OSError:
+                entries_by_dir[directory] = set()
+        
+        if name in entries_by_dir[directory]:
             print(f"✓ {file_path} exists")
         else:
             print(f"❌ {file_path} is missing")
@@ -233,17 +250,55 @@ def test_file_structure():
     return True
 
 
+class _ThreadOutput:
+    """
+    stdout replacement that gives each worker thread its own buffer.
+    
+    Checks run in parallel print progress lines; buffering them per thread
+    keeps each check's output together when it is reported.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        """Start buffering output written by the current thread."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def _run_check(output, test_func):
+    """Run one check in a worker thread, returning (result, error, printed output)."""
+    buffer = output.capture()
+    try:
+        return test_func(), None, buffer.getvalue()
+    except Exception as e:
+        return False, e, buffer.getvalue()
+
+
 def run_deployment_validation():
     """Run all deployment validation tests"""
     print("=" * 60)
     print("MCP Base64 Server Deployment Validation")
     print("=" * 60)
     
-    tests = [
+    # Independent, I/O- and import-bound checks run concurrently
+    parallel_tests = [
         ("File Structure", test_file_structure),
         ("Requirements Installation", test_requirements_installation),
         ("Configuration Loading", test_configuration_loading),
         ("Base64 Service", test_base64_service),
+    ]
+    # These run afterwards on the main thread (the HTTP check binds a port)
+    serial_tests = [
         ("MCP Protocol Handler", test_mcp_protocol_handler),
         ("HTTP Server", test_http_server),
     ]
@@ -251,18 +306,42 @@ def run_deployment_validation():
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    def report(test_name, result, error):
+        nonlocal passed, failed
+        if error is not None:
+            failed += 1
+            print(f"❌ {test_name} FAILED: {error}")
+        elif result:
+            passed += 1
+            print(f"✅ {test_name} PASSED")
+        else:
+            failed += 1
+            print(f"❌ {test_name} FAILED")
+    
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                (test_name, executor.submit(_run_check, output, test_func))
+                for test_name, test_func in parallel_tests
+            ]
+            # Report in the listed order, each with the output it printed
+            for test_name, future in futures:
+                result, error, printed = future.result()
+                print(f"\n--- {test_name} ---")
+                print(printed, end="")
+                report(test_name, result, error)
+    finally:
+        sys.stdout = output._stream
+    
+    for test_name, test_func in serial_tests:
         print(f"\n--- {test_name} ---")
         try:
-            if test_func():
-                passed += 1
-                print(f"✅ {test_name} PASSED")
-            else:
-                failed += 1
-                print(f"❌ {test_name} FAILED")
+            result, error = test_func(), None
         except Exception as e:
-            failed += 1
-            print(f"❌ {test_name} FAILED: {e}")
+            result, error = False, e
+        report(test_name, result, error)
     
     print("\n" + "=" * 60)
     print(f"Results: {passed} passed, {failed} failed")
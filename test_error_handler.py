@@ -6,20 +6,55 @@ exception handling, and logging integration.
 """
 
 import logging
-import unittest
-from unittest.mock import Mock, patch
+import sys
+import threading
+
+import pytest
+
 from services.error_handler import ErrorHandler
 from models.mcp_models import MCPError, MCPErrorCodes
 
 
-class TestErrorHandler(unittest.TestCase):
+class _Recorder:
+    """Records calls to one logger method"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+    
+    def assert_called_once(self):
+        if len(self.calls) != 1:
+            raise AssertionError(f"Expected 1 call, got {len(self.calls)}")
+    
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        if self.calls[0] != (args, kwargs):
+            raise AssertionError(f"Expected call {(args, kwargs)}, got {self.calls[0]}")
+
+
+class _LoggerStub:
+    """Minimal logger recording error/exception calls, cheaper than Mock(spec=Logger)"""
+    
+    def __init__(self):
+        self.error = _Recorder()
+        self.exception = _Recorder()
+        self.debug = self.info = self.warning = lambda *args, **kwargs: None
+
+
+class TestErrorHandler:
     """Test suite for ErrorHandler implementation"""
     
-    def setUp(self):
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all tests"""
+        cls.error_handler_default = ErrorHandler()  # Test with default logger
+    
+    def setup_method(self):
         """Set up test fixtures"""
-        self.mock_logger = Mock(spec=logging.Logger)
+        self.mock_logger = _LoggerStub()
         self.error_handler = ErrorHandler(logger=self.mock_logger)
-        self.error_handler_default = ErrorHandler()  # Test with default logger
     
     def test_create_error_basic(self):
         """Test basic error creation"""
@@ -29,10 +64,10 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.create_error(code, message, data)
         
-        self.assertIsInstance(error, MCPError)
-        self.assertEqual(error.code, code)
-        self.assertEqual(error.message, message)
-        self.assertEqual(error.data, data)
+        assert isinstance(error, MCPError)
+        assert error.code == code
+        assert error.message == message
+        assert error.data == data
         
         # Verify logging was called
         self.mock_logger.error.assert_called_once()
@@ -44,154 +79,97 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.create_error(code, message)
         
-        self.assertEqual(error.code, code)
-        self.assertEqual(error.message, message)
-        self.assertIsNone(error.data)
-    
-    def test_create_parse_error(self):
-        """Test parse error creation"""
-        details = "Invalid JSON syntax"
-        error = self.error_handler.create_parse_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.PARSE_ERROR)
-        self.assertEqual(error.message, "Parse error")
-        self.assertEqual(error.data["details"], details)
+        assert error.code == code
+        assert error.message == message
+        assert error.data is None
+    
+    # (factory method, argument, expected code, expected message, data key)
+    CREATE_ERROR_CASES = (
+        ("create_parse_error", "Invalid JSON syntax",
+         MCPErrorCodes.PARSE_ERROR, "Parse error", "details"),
+        ("create_invalid_request_error", "Missing required field",
+         MCPErrorCodes.INVALID_REQUEST, "Invalid Request", "details"),
+        ("create_method_not_found_error", "unknown/method",
+         MCPErrorCodes.METHOD_NOT_FOUND, "Method not found", "method"),
+        ("create_invalid_params_error", "Parameter validation failed",
+         MCPErrorCodes.INVALID_PARAMS, "Invalid params", "details"),
+        ("create_internal_error", "Database connection failed",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "details"),
+        ("create_invalid_base64_error", "Contains invalid characters",
+         MCPErrorCodes.INVALID_BASE64, "Invalid base64 string", "details"),
+        ("create_encoding_error", "UTF-8 encoding failed",
+         MCPErrorCodes.ENCODING_ERROR, "Encoding error", "details"),
+        ("create_decoding_error", "Base64 decoding failed",
+         MCPErrorCodes.DECODING_ERROR, "Decoding error", "details"),
+        ("create_tool_not_found_error", "unknown_tool",
+         MCPErrorCodes.TOOL_NOT_FOUND, "Tool not found", "tool_name"),
+    )
+    
+    @pytest.mark.parametrize(
+        "method_name,argument,code,message,data_key", CREATE_ERROR_CASES,
+        ids=[case[0] for case in CREATE_ERROR_CASES]
+    )
+    def test_create_specific_errors(self, method_name, argument, code, message, data_key):
+        """Test creation of each specific error type"""
+        error = getattr(self.error_handler, method_name)(argument)
+        
+        assert error.code == code
+        assert error.message == message
+        assert error.data[data_key] == argument
     
     def test_create_parse_error_default(self):
         """Test parse error creation with default details"""
         error = self.error_handler.create_parse_error()
         
-        self.assertEqual(error.code, MCPErrorCodes.PARSE_ERROR)
-        self.assertEqual(error.message, "Parse error")
-        self.assertEqual(error.data["details"], "Invalid JSON format")
-    
-    def test_create_invalid_request_error(self):
-        """Test invalid request error creation"""
-        details = "Missing required field"
-        error = self.error_handler.create_invalid_request_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertEqual(error.message, "Invalid Request")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_method_not_found_error(self):
-        """Test method not found error creation"""
-        method = "unknown/method"
-        error = self.error_handler.create_method_not_found_error(method)
-        
-        self.assertEqual(error.code, MCPErrorCodes.METHOD_NOT_FOUND)
-        self.assertEqual(error.message, "Method not found")
-        self.assertEqual(error.data["method"], method)
-    
-    def test_create_invalid_params_error(self):
-        """Test invalid params error creation"""
-        details = "Parameter validation failed"
-        error = self.error_handler.create_invalid_params_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_PARAMS)
-        self.assertEqual(error.message, "Invalid params")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_internal_error(self):
-        """Test internal error creation"""
-        details = "Database connection failed"
-        error = self.error_handler.create_internal_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_invalid_base64_error(self):
-        """Test invalid base64 error creation"""
-        details = "Contains invalid characters"
-        error = self.error_handler.create_invalid_base64_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_BASE64)
-        self.assertEqual(error.message, "Invalid base64 string")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_encoding_error(self):
-        """Test encoding error creation"""
-        details = "UTF-8 encoding failed"
-        error = self.error_handler.create_encoding_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.ENCODING_ERROR)
-        self.assertEqual(error.message, "Encoding error")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_decoding_error(self):
-        """Test decoding error creation"""
-        details = "Base64 decoding failed"
-        error = self.error_handler.create_decoding_error(details)
-        
-        self.assertEqual(error.code, MCPErrorCodes.DECODING_ERROR)
-        self.assertEqual(error.message, "Decoding error")
-        self.assertEqual(error.data["details"], details)
-    
-    def test_create_tool_not_found_error(self):
-        """Test tool not found error creation"""
-        tool_name = "unknown_tool"
-        error = self.error_handler.create_tool_not_found_error(tool_name)
-        
-        self.assertEqual(error.code, MCPErrorCodes.TOOL_NOT_FOUND)
-        self.assertEqual(error.message, "Tool not found")
-        self.assertEqual(error.data["tool_name"], tool_name)
-    
-    def test_handle_value_error(self):
-        """Test handling ValueError exception"""
-        exception = ValueError("Invalid input value")
-        context = "Base64 encoding"
-        
+        assert error.code == MCPErrorCodes.PARSE_ERROR
+        assert error.message == "Parse error"
+        assert error.data["details"] == "Invalid JSON format"
+    
+    # (exception, context, expected code, expected message, expected text in details)
+    HANDLE_EXCEPTION_CASES = (
+        (ValueError("Invalid input value"), "Base64 encoding",
+         MCPErrorCodes.INVALID_PARAMS, "Invalid params", "Base64 encoding: Invalid input value"),
+        (KeyError("missing_key"), "Request processing",
+         MCPErrorCodes.INVALID_REQUEST, "Invalid Request", "Request processing"),
+        (NotImplementedError("Feature not ready"), "Tool execution",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Feature not implemented"),
+        (TypeError("Expected string, got int"), "Parameter validation",
+         MCPErrorCodes.INVALID_PARAMS, "Invalid params", "Type error"),
+        (AttributeError("'NoneType' object has no attribute 'method'"), "",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Attribute error"),
+        (ImportError("No module named 'missing_module'"), "",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Import error"),
+        (ConnectionError("Connection refused"), "",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Connection error"),
+        (TimeoutError("Operation timed out"), "",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Timeout error"),
+        (RuntimeError("Unexpected error"), "Server operation",
+         MCPErrorCodes.INTERNAL_ERROR, "Internal error", "Server operation: Unexpected error"),
+    )
+    
+    @pytest.mark.parametrize(
+        "exception,context,code,message,details", HANDLE_EXCEPTION_CASES,
+        ids=[type(case[0]).__name__ for case in HANDLE_EXCEPTION_CASES]
+    )
+    def test_handle_exceptions(self, exception, context, code, message, details):
+        """Test handling of each exception type"""
         error = self.error_handler.handle_exception(exception, context)
         
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_PARAMS)
-        self.assertEqual(error.message, "Invalid params")
-        self.assertIn("Base64 encoding: Invalid input value", error.data["details"])
+        assert error.code == code
+        assert error.message == message
+        assert details in error.data["details"]
         
         # Verify exception logging was called
         self.mock_logger.exception.assert_called_once()
     
-    def test_handle_key_error(self):
-        """Test handling KeyError exception"""
-        exception = KeyError("missing_key")
-        context = "Request processing"
-        
-        error = self.error_handler.handle_exception(exception, context)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertEqual(error.message, "Invalid Request")
-        self.assertIn("Request processing", error.data["details"])
-    
-    def test_handle_not_implemented_error(self):
-        """Test handling NotImplementedError exception"""
-        exception = NotImplementedError("Feature not ready")
-        context = "Tool execution"
-        
-        error = self.error_handler.handle_exception(exception, context)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Feature not implemented", error.data["details"])
-    
-    def test_handle_generic_exception(self):
-        """Test handling generic exception"""
-        exception = RuntimeError("Unexpected error")
-        context = "Server operation"
-        
-        error = self.error_handler.handle_exception(exception, context)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Server operation: Unexpected error", error.data["details"])
-    
     def test_handle_exception_without_context(self):
         """Test handling exception without context"""
         exception = ValueError("Test error")
         
         error = self.error_handler.handle_exception(exception)
         
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_PARAMS)
-        self.assertEqual(error.data["details"], "Test error")
+        assert error.code == MCPErrorCodes.INVALID_PARAMS
+        assert error.data["details"] == "Test error"
     
     def test_default_logger_initialization(self):
         """Test ErrorHandler with default logger"""
@@ -199,9 +177,39 @@ class TestErrorHandler(unittest.TestCase):
         handler = ErrorHandler()
         error = handler.create_error(-1000, "Test message")
         
-        self.assertIsInstance(error, MCPError)
-        self.assertEqual(error.code, -1000)
-        self.assertEqual(error.message, "Test message")
+        assert isinstance(error, MCPError)
+        assert error.code == -1000
+        assert error.message == "Test message"
+    
+    def test_default_logger_is_shared(self):
+        """Test handlers without an explicit logger reuse one default logger"""
+        assert ErrorHandler().logger is self.error_handler_default.logger
+        assert self.error_handler_default.logger.name == "services.error_handler"
+    
+    def test_default_logger_dispatches_to_root_handlers(self):
+        """Test default logger records reach the root handlers through the queue listener"""
+        delivered = []
+        received = threading.Event()
+        
+        class _CollectingHandler(logging.Handler):
+            def emit(self, record):
+                if record.name == "services.error_handler":
+                    delivered.append((record.getMessage(), threading.current_thread()))
+                    received.set()
+        
+        root_logger = logging.getLogger()
+        collector = _CollectingHandler(level=logging.ERROR)
+        root_logger.addHandler(collector)
+        try:
+            ErrorHandler().create_error(-1000, "Queued message")
+            assert received.wait(5)
+        finally:
+            root_logger.removeHandler(collector)
+        
+        message, thread = delivered[0]
+        assert "Message: Queued message" in message
+        # Written by the listener thread, not the caller
+        assert thread is not threading.current_thread()
     
     def test_error_logging_format(self):
         """Test that error logging includes all relevant information"""
@@ -211,9 +219,13 @@ class TestErrorHandler(unittest.TestCase):
         
         self.error_handler.create_error(code, message, data)
         
-        # Verify the log message format
+        # Verify the log message format (arguments are formatted lazily by logging)
+        self.mock_logger.error.assert_called_once_with(
+            "Error created - Code: %s, Message: %s, Data: %s", code, message, data
+        )
+        log_args = self.mock_logger.error.calls[0][0]
         expected_log = f"Error created - Code: {code}, Message: {message}, Data: {data}"
-        self.mock_logger.error.assert_called_once_with(expected_log)
+        assert log_args[0] % log_args[1:] == expected_log
     
     def test_exception_logging_format(self):
         """Test that exception logging includes context and exception details"""
@@ -223,58 +235,28 @@ class TestErrorHandler(unittest.TestCase):
         self.error_handler.handle_exception(exception, context)
         
         # Verify exception logging was called
-        self.mock_logger.exception.assert_called_once_with(f"Exception handled: {context}: {str(exception)}")
-    
-    def test_handle_type_error(self):
-        """Test handling TypeError exception"""
-        exception = TypeError("Expected string, got int")
-        context = "Parameter validation"
-        
-        error = self.error_handler.handle_exception(exception, context)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_PARAMS)
-        self.assertEqual(error.message, "Invalid params")
-        self.assertIn("Type error", error.data["details"])
-    
-    def test_handle_attribute_error(self):
-        """Test handling AttributeError exception"""
-        exception = AttributeError("'NoneType' object has no attribute 'method'")
-        
-        error = self.error_handler.handle_exception(exception)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Attribute error", error.data["details"])
+        self.mock_logger.exception.assert_called_once_with("Exception handled: %s", f"{context}: {str(exception)}")
     
-    def test_handle_import_error(self):
-        """Test handling ImportError exception"""
-        exception = ImportError("No module named 'missing_module'")
+    def test_handle_exception_subclass(self):
+        """Test that exception subclasses map like their base class"""
+        exception = ModuleNotFoundError("No module named 'missing_module'")
         
         error = self.error_handler.handle_exception(exception)
         
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Import error", error.data["details"])
+        assert error.code == MCPErrorCodes.INTERNAL_ERROR
+        assert "Import error" in error.data["details"]
     
-    def test_handle_connection_error(self):
-        """Test handling ConnectionError exception"""
-        exception = ConnectionError("Connection refused")
-        
-        error = self.error_handler.handle_exception(exception)
+    def test_handle_exception_multiple_bases(self):
+        """Test that an exception with several mapped bases uses the highest-priority one"""
+        class TypeAndValueError(TypeError, ValueError):
+            pass
         
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Connection error", error.data["details"])
-    
-    def test_handle_timeout_error(self):
-        """Test handling TimeoutError exception"""
-        exception = TimeoutError("Operation timed out")
-        
-        error = self.error_handler.handle_exception(exception)
-        
-        self.assertEqual(error.code, MCPErrorCodes.INTERNAL_ERROR)
-        self.assertEqual(error.message, "Internal error")
-        self.assertIn("Timeout error", error.data["details"])
+        # Repeat so the cached dispatch entry is exercised as well
+        for _ in range(2):
+            error = self.error_handler.handle_exception(TypeAndValueError("Both"))
+            
+            assert error.code == MCPErrorCodes.INVALID_PARAMS
+            assert error.data["details"] == "Both"
     
     def test_validate_request_format_valid(self):
         """Test validation of valid MCP request format"""
@@ -287,7 +269,7 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(valid_request)
         
-        self.assertIsNone(error)
+        assert error is None
     
     def test_validate_request_format_not_dict(self):
         """Test validation fails for non-dict request"""
@@ -295,9 +277,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("must be a JSON object", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "must be a JSON object" in error.data["details"]
     
     def test_validate_request_format_missing_jsonrpc(self):
         """Test validation fails for missing jsonrpc field"""
@@ -308,9 +290,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("Missing 'jsonrpc' field", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "Missing 'jsonrpc' field" in error.data["details"]
     
     def test_validate_request_format_invalid_jsonrpc_version(self):
         """Test validation fails for invalid jsonrpc version"""
@@ -321,9 +303,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("Invalid 'jsonrpc' version", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "Invalid 'jsonrpc' version" in error.data["details"]
     
     def test_validate_request_format_missing_method(self):
         """Test validation fails for missing method field"""
@@ -334,9 +316,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("Missing 'method' field", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "Missing 'method' field" in error.data["details"]
     
     def test_validate_request_format_invalid_method_type(self):
         """Test validation fails for non-string method"""
@@ -347,9 +329,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("'method' field must be a string", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "'method' field must be a string" in error.data["details"]
     
     def test_validate_request_format_invalid_id_type(self):
         """Test validation fails for invalid id type"""
@@ -361,9 +343,20 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("'id' field must be string, number, or null", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "'id' field must be string, number, or null" in error.data["details"]
+    
+    def test_validate_request_format_numeric_id(self):
+        """Test validation accepts integer and float ids (JSON-RPC Number)"""
+        for id_value in (1, 1.5, None):
+            request = {
+                "jsonrpc": "2.0",
+                "method": "tools/list",
+                "id": id_value
+            }
+            
+            assert self.error_handler.validate_request_format(request) is None
     
     def test_validate_request_format_invalid_params_type(self):
         """Test validation fails for non-object params"""
@@ -375,9 +368,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_request_format(invalid_request)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_REQUEST)
-        self.assertIn("'params' field must be an object", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_REQUEST
+        assert "'params' field must be an object" in error.data["details"]
     
     def test_validate_base64_format_valid(self):
         """Test validation of valid base64 string"""
@@ -385,7 +378,7 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(valid_base64)
         
-        self.assertIsNone(error)
+        assert error is None
     
     def test_validate_base64_format_not_string(self):
         """Test validation fails for non-string input"""
@@ -393,9 +386,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(invalid_input)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_BASE64)
-        self.assertIn("must be a string", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_BASE64
+        assert "must be a string" in error.data["details"]
     
     def test_validate_base64_format_empty_string(self):
         """Test validation fails for empty string"""
@@ -403,9 +396,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(empty_string)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_BASE64)
-        self.assertIn("cannot be empty", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_BASE64
+        assert "cannot be empty" in error.data["details"]
     
     def test_validate_base64_format_invalid_characters(self):
         """Test validation fails for invalid characters"""
@@ -413,9 +406,17 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(invalid_base64)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_BASE64)
-        self.assertIn("invalid characters", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_BASE64
+        assert "invalid characters" in error.data["details"]
+    
+    @pytest.mark.parametrize("invalid_base64", ["SGVsb===", "SG=sbG8=", "SGVsbG8\u00e9"])
+    def test_validate_base64_format_bad_padding_and_non_ascii(self, invalid_base64):
+        """Test validation fails for misplaced padding and non-ASCII characters"""
+        error = self.error_handler.validate_base64_format(invalid_base64)
+        
+        assert error is not None
+        assert "invalid characters" in error.data["details"]
     
     def test_validate_base64_format_invalid_length(self):
         """Test validation fails for invalid length"""
@@ -423,9 +424,9 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(invalid_base64)
         
-        self.assertIsNotNone(error)
-        self.assertEqual(error.code, MCPErrorCodes.INVALID_BASE64)
-        self.assertIn("multiple of 4", error.data["details"])
+        assert error is not None
+        assert error.code == MCPErrorCodes.INVALID_BASE64
+        assert "multiple of 4" in error.data["details"]
     
     def test_validate_base64_format_with_whitespace(self):
         """Test validation handles whitespace correctly"""
@@ -433,7 +434,7 @@ class TestErrorHandler(unittest.TestCase):
         
         error = self.error_handler.validate_base64_format(base64_with_whitespace)
         
-        self.assertIsNone(error)  # Should be valid after removing whitespace
+        assert error is None
     
     def test_create_http_error_response_basic(self):
         """Test creation of basic HTTP error response"""
@@ -442,10 +443,10 @@ class TestErrorHandler(unittest.TestCase):
         
         response = self.error_handler.create_http_error_response(status_code, message)
         
-        self.assertFalse(response["success"])
-        self.assertEqual(response["error"]["code"], status_code)
-        self.assertEqual(response["error"]["message"], message)
-        self.assertNotIn("details", response["error"])
+        assert not response["success"]
+        assert response["error"]["code"] == status_code
+        assert response["error"]["message"] == message
+        assert "details" not in response["error"]
         
         # Verify logging was called
         self.mock_logger.error.assert_called_once()
@@ -458,11 +459,11 @@ class TestErrorHandler(unittest.TestCase):
         
         response = self.error_handler.create_http_error_response(status_code, message, details)
         
-        self.assertFalse(response["success"])
-        self.assertEqual(response["error"]["code"], status_code)
-        self.assertEqual(response["error"]["message"], message)
-        self.assertEqual(response["error"]["details"], details)
+        assert not response["success"]
+        assert response["error"]["code"] == status_code
+        assert response["error"]["message"] == message
+        assert response["error"]["details"] == details
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
\ No newline at end of file
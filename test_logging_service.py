@@ -6,6 +6,7 @@ including structured logging, different formatters, and logging operations.
 """
 
 import unittest
+import dataclasses
 import logging
 import json
 import tempfile
@@ -69,6 +70,18 @@ class TestLogEntry(unittest.TestCase):
         
         self.assertEqual(result, expected)
     
+    def test_log_entry_is_immutable(self):
+        """Test that log entries cannot be modified after creation."""
+        entry = LogEntry(
+            timestamp="2024-01-01T12:00:00",
+            level="INFO",
+            logger_name="test.logger",
+            message="Test message"
+        )
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            entry.message = "Changed"
+    
     def test_log_entry_to_json(self):
         """Test converting log entry to JSON."""
         entry = LogEntry(
@@ -85,6 +98,20 @@ class TestLogEntry(unittest.TestCase):
         self.assertEqual(parsed['level'], "INFO")
         self.assertEqual(parsed['logger_name'], "test.logger")
         self.assertEqual(parsed['message'], "Test message")
+    
+    def test_log_entry_to_json_keeps_unicode(self):
+        """Test that non-ASCII text is emitted as-is rather than escaped."""
+        entry = LogEntry(
+            timestamp="2024-01-01T12:00:00",
+            level="INFO",
+            logger_name="test.logger",
+            message="编码成功"
+        )
+        
+        result = entry.to_json()
+        
+        self.assertIn("编码成功", result)
+        self.assertEqual(json.loads(result)['message'], "编码成功")
 
 
 class TestStructuredFormatter(unittest.TestCase):
@@ -175,7 +202,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
         result = self.formatter.format(record)
         
         self.assertIn("Test message", result)
-        self.assertIn('"key": "value"', result)
+        self.assertIn('"key":"value"', result)
     
     def test_format_debug_record_includes_location(self):
         """Test that DEBUG level records include location info."""
@@ -306,6 +333,17 @@ class TestLoggingService(unittest.TestCase):
             self.assertIn("Test error", output)
             self.assertIn("Test context", output)
     
+    def test_log_error_skipped_when_error_disabled(self):
+        """Test that log_error does nothing when ERROR level is disabled."""
+        self.service.configure(level="ERROR")
+        logger = self.service.get_logger("test.logger")
+        
+        with patch.object(logger, 'isEnabledFor', return_value=False), \
+                patch.object(logger, 'error') as mock_error:
+            self.service.log_error(logger_name="test.logger", error=ValueError("Test error"))
+        
+        mock_error.assert_not_called()
+    
     def test_get_log_stats(self):
         """Test getting log statistics."""
         self.service.configure(level="DEBUG", use_structured_format=True)
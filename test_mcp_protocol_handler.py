@@ -8,12 +8,16 @@ and error scenarios.
 
 import pytest
 import json
+import logging
+import threading
+import time
 from unittest.mock import Mock, patch
 from models.mcp_models import (
     MCPRequest, MCPResponse, MCPError, ToolResult,
     MCPMethods, MCPErrorCodes
 )
-from services.mcp_protocol_handler import MCPProtocolHandler
+from services.mcp_protocol_handler import LOG_BUFFER_SIZE, MCPProtocolHandler
+from services.performance_monitor import RequestMetricsHandle
 from services.base64_service import Base64Service
 
 
@@ -28,7 +32,9 @@ class TestMCPProtocolHandler:
     @pytest.fixture
     def handler(self, base64_service):
         """创建MCPProtocolHandler实例"""
-        return MCPProtocolHandler(base64_service)
+        handler = MCPProtocolHandler(base64_service)
+        yield handler
+        handler.close()
     
     def test_initialization(self, handler):
         """测试协议处理器初始化"""
@@ -60,6 +66,27 @@ class TestMCPProtocolHandler:
         assert encode_tool["description"] == "将文本字符串编码为base64格式"
         assert "inputSchema" in encode_tool
     
+    def test_list_tools_result_is_cached(self, handler):
+        """测试工具列表响应数据只构建一次"""
+        first = handler.handle_request(MCPRequest(id="a", method=MCPMethods.LIST_TOOLS))
+        second = handler.handle_request(MCPRequest(id="b", method=MCPMethods.LIST_TOOLS))
+        
+        assert first.id == "a"
+        assert second.id == "b"
+        assert first.result is second.result
+    
+    def test_static_results_use_preserialized_json(self, handler):
+        """测试静态响应结果使用预序列化JSON，输出与直接序列化一致"""
+        for method in (MCPMethods.LIST_TOOLS, MCPMethods.INITIALIZE, MCPMethods.PING):
+            response = handler.handle_request(MCPRequest(id="static-1", method=method))
+            with patch.object(MCPResponse, 'to_json', autospec=True) as mock_to_json:
+                serialized = handler.serialize_response(response)
+            mock_to_json.assert_not_called()
+            assert serialized == json.dumps(response.to_dict())
+        
+        error_response = handler.handle_request(MCPRequest(id="static-2", method="unknown/method"))
+        assert handler.serialize_response(error_response) == error_response.to_json()
+    
     def test_handle_call_tool_encode_success(self, handler):
         """测试成功的base64编码工具调用"""
         request = MCPRequest(
@@ -121,6 +148,34 @@ class TestMCPProtocolHandler:
         assert response.error.code == MCPErrorCodes.INVALID_PARAMS
         assert "Missing required parameter: name" in response.error.message
     
+    def test_handle_call_tool_null_params(self, handler):
+        """测试params为null时返回参数错误"""
+        request = MCPRequest(id="test-null-params", method=MCPMethods.CALL_TOOL, params=None)
+        
+        with patch.object(handler.logger, 'error') as mock_error:
+            response = handler.handle_request(request)
+        
+        assert response.error is not None
+        assert response.error.code == MCPErrorCodes.INVALID_PARAMS
+        assert "params must be an object" in response.error.message
+        mock_error.assert_not_called()
+    
+    def test_handle_call_tool_non_object_arguments(self, handler):
+        """测试arguments不是对象时返回参数错误"""
+        request = MCPRequest(
+            id="test-bad-arguments",
+            method=MCPMethods.CALL_TOOL,
+            params={"name": "base64_encode", "arguments": "x"}
+        )
+        
+        with patch.object(handler.logger, 'error') as mock_error:
+            response = handler.handle_request(request)
+        
+        assert response.error is not None
+        assert response.error.code == MCPErrorCodes.INVALID_PARAMS
+        assert "arguments must be an object" in response.error.message
+        mock_error.assert_not_called()
+    
     def test_handle_call_tool_unknown_tool(self, handler):
         """测试调用不存在的工具"""
         request = MCPRequest(
@@ -260,6 +315,25 @@ class TestMCPProtocolHandler:
         assert response.error is None
         assert response.result["status"] == "pong"
     
+    def test_handle_requests_batch(self, handler):
+        """测试批量请求按顺序返回响应"""
+        requests = [
+            MCPRequest(id=1, method=MCPMethods.PING),
+            MCPRequest(id=2, method="unknown/method"),
+            MCPRequest(
+                id=3,
+                method=MCPMethods.CALL_TOOL,
+                params={"name": "base64_encode", "arguments": {"text": "Hello"}}
+            )
+        ]
+        
+        responses = handler.handle_requests(requests)
+        
+        assert [response.id for response in responses] == [1, 2, 3]
+        assert responses[0].error is None
+        assert responses[1].error.code == MCPErrorCodes.METHOD_NOT_FOUND
+        assert responses[2].result["content"][0]["text"] == "SGVsbG8="
+    
     def test_handle_unknown_method(self, handler):
         """测试未知方法请求"""
         request = MCPRequest(
@@ -292,6 +366,111 @@ class TestMCPProtocolHandler:
         assert response.error.code == MCPErrorCodes.INVALID_REQUEST
         assert "Invalid request format" in response.error.message
     
+    def test_request_log_skipped_when_level_disabled(self, handler):
+        """测试日志级别未启用时不记录请求日志"""
+        request = MCPRequest(id="test-log", method=MCPMethods.PING, params={})
+        
+        with patch.object(handler.logger, 'isEnabledFor', return_value=False), \
+                patch('services.mcp_protocol_handler.make_request_record') as mock_make_record:
+            response = handler.handle_request(request)
+        
+        assert response.error is None
+        mock_make_record.assert_not_called()
+    
+    def test_request_records_flushed_on_close(self, handler):
+        """测试性能记录先缓冲，关闭时写出"""
+        request = MCPRequest(id="test-flush", method=MCPMethods.PING, params={})
+        
+        with patch.object(RequestMetricsHandle, 'add', autospec=True) as mock_record_request:
+            handler._flush_stop.set()
+            handler._flush_thread.join()
+            handler.handle_request(request)
+            
+            mock_record_request.assert_not_called()
+            handler.close()
+        
+        mock_record_request.assert_called_once()
+        assert mock_record_request.call_args[0][0].operation == "mcp_ping"
+    
+    def test_large_batch_records_not_dropped(self, handler):
+        """测试超过缓冲阈值的批量请求的性能记录全部写出"""
+        count = LOG_BUFFER_SIZE * 3
+        with patch.object(RequestMetricsHandle, 'add', autospec=True) as mock_record_request:
+            handler._flush_stop.set()
+            handler._flush_thread.join()
+            responses = handler.handle_requests(
+                [MCPRequest(id=i, method=MCPMethods.PING) for i in range(count)]
+            )
+            
+            assert len(handler._log_buffer) < LOG_BUFFER_SIZE
+            handler.close()
+        
+        assert len(responses) == count
+        assert mock_record_request.call_count == count
+    
+    def test_request_metric_labels_shared(self, handler):
+        """测试相同方法的请求共享性能监控标签"""
+        with patch.object(RequestMetricsHandle, 'add', autospec=True) as mock_record_request:
+            handler.handle_request(MCPRequest(id=1, method=MCPMethods.PING))
+            handler.handle_request(MCPRequest(id=2, method=MCPMethods.PING))
+            handler.close()
+        
+        first, second = (c[0][3] for c in mock_record_request.call_args_list)
+        assert first is second
+        assert first == {'method': 'ping', 'has_params': False, 'error_code': None}
+    
+    def test_buffered_records_keep_request_time_and_thread(self, handler):
+        """测试缓冲的日志和性能记录保留请求发生时的时间和线程"""
+        handler._flush_stop.set()
+        handler._flush_thread.join()
+        emitted = []
+        
+        with patch.object(handler.logger, 'isEnabledFor', return_value=True), \
+                patch.object(handler.logger, 'callHandlers', side_effect=emitted.append), \
+                patch.object(RequestMetricsHandle, 'add', autospec=True) as mock_record_request:
+            before = time.time()
+            handler.handle_request(MCPRequest(id="test-time", method=MCPMethods.PING))
+            after = time.time()
+            
+            # 在其他线程中延迟写出
+            time.sleep(0.05)
+            flusher = threading.Thread(target=handler.flush, name="test-flusher")
+            flusher.start()
+            flusher.join()
+        
+        (record,) = [r for r in emitted if r.getMessage().startswith("Request ping")]
+        assert before <= record.created <= after
+        assert record.threadName == threading.current_thread().name
+        timestamp = mock_record_request.call_args[0][4]
+        assert before <= timestamp <= after
+    
+    def test_exception_request_log_precedes_error_log(self, handler):
+        """测试异常路径的500请求日志与错误日志同步记录且顺序正确"""
+        handler._flush_stop.set()
+        handler._flush_thread.join()
+        emitted = []
+        
+        with patch.dict(handler._dispatch, {MCPMethods.PING: Mock(side_effect=RuntimeError("boom"))}), \
+                patch.object(handler.logger, 'isEnabledFor', return_value=True), \
+                patch.object(handler.logger, 'callHandlers', side_effect=emitted.append):
+            response = handler.handle_request(MCPRequest(id="test-500", method=MCPMethods.PING))
+        
+        assert response.error is not None
+        assert [r.levelno for r in emitted] == [logging.ERROR, logging.ERROR]
+        assert "-> 500" in emitted[0].getMessage()
+        assert emitted[1].exc_info is not None
+        assert not handler._log_buffer
+    
+    def test_request_metrics_skipped_when_monitoring_disabled(self, handler):
+        """测试性能监控关闭时不记录性能数据"""
+        with patch('services.performance_monitor.ENABLED', False), \
+                patch.object(RequestMetricsHandle, 'add', autospec=True) as mock_record_request:
+            response = handler.handle_request(MCPRequest(id=1, method=MCPMethods.PING))
+            handler.close()
+        
+        assert response.error is None
+        mock_record_request.assert_not_called()
+    
     def test_handle_request_with_exception(self, handler):
         """测试请求处理过程中发生异常"""
         # 模拟Base64Service抛出异常
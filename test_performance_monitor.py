@@ -8,11 +8,13 @@ including request tracking, system monitoring, and metrics collection.
 import unittest
 import time
 import threading
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 from services.performance_monitor import (
-    PerformanceMonitor, MetricPoint, RequestMetrics, MetricType,
-    record_request, get_performance_summary, start_system_monitoring, stop_system_monitoring
+    PerformanceMonitor, MetricPoint, RequestMetrics, MetricType, FloatRingBuffer,
+    record_request, get_performance_summary, start_system_monitoring, stop_system_monitoring,
+    get_performance_monitor
 )
 
 
@@ -48,6 +50,46 @@ class TestMetricPoint(unittest.TestCase):
         self.assertEqual(result['value'], 100.0)
         self.assertEqual(result['labels'], {'key': 'value'})
         self.assertIn('datetime', result)
+    
+    def test_metric_point_without_labels(self):
+        """Test a point without labels stores None but exports empty labels."""
+        point = MetricPoint(timestamp=time.time(), value=1.0)
+        
+        self.assertIsNone(point.labels)
+        self.assertEqual(point.to_dict()['labels'], {})
+    
+    def test_metric_point_datetime_format(self):
+        """Test datetime formatting matches datetime.isoformat()."""
+        for timestamp in (1700000000.0, 1700000000.25, 1700000000.9999996, time.time()):
+            point = MetricPoint(timestamp=timestamp, value=1.0)
+            self.assertEqual(
+                point.to_dict()['datetime'],
+                datetime.fromtimestamp(timestamp).isoformat()
+            )
+
+
+class TestFloatRingBuffer(unittest.TestCase):
+    """Test FloatRingBuffer class."""
+    
+    def test_append_until_full(self):
+        """Test values are kept in order before the buffer wraps."""
+        ring = FloatRingBuffer(3)
+        
+        self.assertEqual(ring.append(1.0), 0.0)
+        self.assertEqual(ring.append(2.0), 0.0)
+        
+        self.assertEqual(len(ring), 2)
+        self.assertEqual(list(ring), [1.0, 2.0])
+    
+    def test_append_evicts_oldest(self):
+        """Test the oldest value is overwritten and returned once full."""
+        ring = FloatRingBuffer(3, [1.0, 2.0, 3.0])
+        
+        self.assertEqual(ring.append(4.0), 1.0)
+        self.assertEqual(ring.append(5.0), 2.0)
+        
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(list(ring), [3.0, 4.0, 5.0])
 
 
 class TestRequestMetrics(unittest.TestCase):
@@ -115,6 +157,14 @@ class TestRequestMetrics(unittest.TestCase):
         expected_recent_avg = (100 + 110 + 120 + 130 + 140) / 5
         self.assertEqual(self.metrics.recent_average_duration_ms, expected_recent_avg)
     
+    def test_recent_average_duration_after_eviction(self):
+        """Test recent average only covers the last 100 requests."""
+        for i in range(150):
+            self.metrics.add_request(float(i), True)
+        
+        expected_recent_avg = sum(range(50, 150)) / 100
+        self.assertAlmostEqual(self.metrics.recent_average_duration_ms, expected_recent_avg)
+    
     def test_to_dict(self):
         """Test converting metrics to dictionary."""
         self.metrics.add_request(100.0, True)
@@ -160,6 +210,17 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertEqual(point.value, 123.45)
         self.assertEqual(point.labels['op'], 'test')
     
+    def test_record_metric_ignores_clock_adjustments(self):
+        """Test metric timestamps follow the monotonic clock."""
+        self.monitor.record_metric(MetricType.SYSTEM_CPU, 10.0)
+        
+        # Simulate the wall clock being set back after start-up
+        with patch('time.time', return_value=0.0):
+            self.monitor.record_metric(MetricType.SYSTEM_CPU, 20.0)
+        
+        first, second = self.monitor._metrics[MetricType.SYSTEM_CPU.value]
+        self.assertGreaterEqual(second.timestamp, first.timestamp)
+    
     def test_record_request(self):
         """Test recording a request."""
         self.monitor.record_request('test_operation', 100.0, True, {'client': 'test'})
@@ -173,6 +234,27 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertEqual(metrics['successful_requests'], 1)
         self.assertEqual(metrics['success_rate'], 100.0)
     
+    def test_register_operation_handle(self):
+        """Test recording through a pre-resolved operation handle."""
+        handle = self.monitor.register_operation('handle_op')
+        self.assertIs(self.monitor.register_operation('handle_op'), handle)
+        
+        handle.add(100.0, True)
+        handle.add(300.0, False, {'client': 'test'})
+        
+        metrics = self.monitor.get_request_metrics('handle_op')['handle_op']
+        self.assertEqual(metrics['total_requests'], 2)
+        self.assertEqual(metrics['failed_requests'], 1)
+        
+        points = self.monitor._metrics[MetricType.REQUEST_DURATION.value]
+        self.assertEqual(points[-1].labels, {'client': 'test', 'operation': 'handle_op'})
+        
+        # Handles stay usable after a reset
+        self.monitor.reset_metrics()
+        handle.add(50.0, True)
+        metrics = self.monitor.get_request_metrics('handle_op')['handle_op']
+        self.assertEqual(metrics['total_requests'], 1)
+    
     def test_connection_tracking(self):
         """Test active connection tracking."""
         self.assertEqual(self.monitor._active_connections, 0)
@@ -193,6 +275,22 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.monitor.decrement_active_connections()
         self.assertEqual(self.monitor._active_connections, 0)
     
+    def test_connection_tracking_concurrent(self):
+        """Test connection tracking from many threads without a lock."""
+        def churn():
+            for _ in range(1000):
+                self.monitor.increment_active_connections()
+            for _ in range(1000):
+                self.monitor.decrement_active_connections()
+        
+        threads = [threading.Thread(target=churn) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(self.monitor._active_connections, 0)
+    
     def test_get_request_metrics_all(self):
         """Test getting all request metrics."""
         self.monitor.record_request('op1', 100.0, True)
@@ -220,6 +318,11 @@ class TestPerformanceMonitor(unittest.TestCase):
         
         self.assertIn('nonexistent', metrics)
         self.assertEqual(metrics['nonexistent']['total_requests'], 0)
+        self.assertEqual(metrics['nonexistent'], RequestMetrics().to_dict())
+        
+        # Each miss gets its own copy of the empty metrics
+        metrics['nonexistent']['total_requests'] = 5
+        self.assertEqual(self.monitor.get_request_metrics('nonexistent')['nonexistent']['total_requests'], 0)
     
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
@@ -263,6 +366,27 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertEqual(cpu_metrics['min'], 50.0)
         self.assertEqual(cpu_metrics['max'], 60.0)
     
+    def test_get_system_metrics_excludes_old_points(self):
+        """Test that points older than the time range are ignored."""
+        cpu_points = self.monitor._metrics[MetricType.SYSTEM_CPU.value]
+        cpu_points.append(MetricPoint(timestamp=time.time() - 3600, value=99.0))
+        self.monitor.record_metric(MetricType.SYSTEM_CPU, 40.0)
+        
+        cpu_metrics = self.monitor.get_system_metrics(time_range_minutes=10)['system_cpu']
+        
+        self.assertEqual(cpu_metrics['data_points'], 1)
+        self.assertEqual(cpu_metrics['max'], 40.0)
+    
+    def test_points_since_whole_history_in_window(self):
+        """Test the whole history is returned in order when every point is recent."""
+        for value in (1.0, 2.0, 3.0):
+            self.monitor.record_metric(MetricType.SYSTEM_CPU, value)
+        
+        points = self.monitor._points_since(MetricType.SYSTEM_CPU.value, 0.0)
+        
+        self.assertEqual([point.value for point in points], [1.0, 2.0, 3.0])
+        self.assertEqual(self.monitor._points_since('missing', 0.0), [])
+    
     def test_get_performance_summary(self):
         """Test getting performance summary."""
         # Add some test data
@@ -312,6 +436,85 @@ class TestPerformanceMonitor(unittest.TestCase):
         self.assertEqual(summary['latest_value'], 200.0)
         self.assertEqual(summary['average'], 150.0)
     
+    def test_get_metrics_for_export_summary_only(self):
+        """Test exporting summaries without per-point data."""
+        self.monitor.record_metric(MetricType.REQUEST_DURATION, 100.0)
+        self.monitor.record_metric(MetricType.REQUEST_DURATION, 300.0)
+        
+        export_data = self.monitor.get_metrics_for_export(time_range_minutes=10, include_data_points=False)
+        
+        duration_metrics = export_data['metrics']['request_duration']
+        self.assertNotIn('data_points', duration_metrics)
+        self.assertEqual(duration_metrics['summary']['average'], 200.0)
+        self.assertEqual(duration_metrics['summary']['max'], 300.0)
+    
+    def test_get_metrics_for_export_request_counts(self):
+        """Test request counts are exported from request metrics."""
+        self.monitor.record_request('test_op', 100.0, True)
+        self.monitor.record_request('test_op', 200.0, False)
+        
+        export_data = self.monitor.get_metrics_for_export(time_range_minutes=10)
+        
+        self.assertEqual(export_data['request_counts']['test_op'], {
+            'request_count': 2,
+            'success_count': 1,
+            'error_count': 1
+        })
+        self.assertEqual(set(export_data['metrics']), {'request_duration'})
+        self.assertEqual(export_data['metrics']['request_duration']['summary']['count'], 2)
+    
+    def test_summary_totals_across_operations(self):
+        """Test summary totals cover every operation and are cleared on reset."""
+        self.monitor.record_request('op1', 100.0, True)
+        self.monitor.register_operation('op2').add(200.0, False)
+        self.monitor.record_request('op2', 300.0, True)
+        
+        summary = self.monitor.get_performance_summary()
+        self.assertEqual(summary['total_requests'], 3)
+        self.assertEqual(summary['successful_requests'], 2)
+        self.assertEqual(summary['failed_requests'], 1)
+        
+        self.monitor.reset_metrics()
+        self.assertEqual(self.monitor.get_performance_summary()['total_requests'], 0)
+    
+    def test_request_metrics_serialized_once_per_update(self):
+        """Test all-operation metrics are reused until another request is recorded."""
+        self.monitor.record_request('op1', 100.0, True)
+        
+        with patch.object(RequestMetrics, 'to_dict', autospec=True, return_value={}) as mock_to_dict:
+            self.monitor.get_performance_summary()
+            self.monitor.get_performance_summary()
+            self.assertEqual(mock_to_dict.call_count, 1)
+            
+            self.monitor.record_request('op1', 200.0, True)
+            self.monitor.get_request_metrics()
+            self.assertEqual(mock_to_dict.call_count, 2)
+        
+        self.monitor.record_request('op1', 300.0, True)
+        self.assertEqual(self.monitor.get_request_metrics()['op1']['total_requests'], 3)
+        
+        self.monitor.reset_metrics()
+        self.assertEqual(self.monitor.get_request_metrics(), {})
+    
+    def test_concurrent_first_records_share_storage(self):
+        """Test concurrent first records of a metric all land in one history."""
+        barrier = threading.Barrier(8)
+        
+        def record():
+            barrier.wait()
+            self.monitor.record_metric(MetricType.SYSTEM_CPU, 1.0)
+            self.monitor.record_request('new_op', 1.0, True)
+        
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(self.monitor._metrics[MetricType.SYSTEM_CPU.value]), 8)
+        self.assertEqual(len(self.monitor._metrics[MetricType.REQUEST_DURATION.value]), 8)
+        self.assertEqual(self.monitor.get_request_metrics('new_op')['new_op']['total_requests'], 8)
+    
     def test_reset_metrics(self):
         """Test resetting metrics."""
         # Add some data
@@ -347,6 +550,13 @@ class TestGlobalFunctions(unittest.TestCase):
         self.assertEqual(summary['total_requests'], 1)
         self.assertEqual(summary['successful_requests'], 1)
     
+    def test_record_request_global_disabled(self):
+        """Test global record_request is a no-op when monitoring is disabled."""
+        with patch('services.performance_monitor.ENABLED', False):
+            record_request('global_test', 123.45, True)
+        
+        self.assertEqual(get_performance_summary()['total_requests'], 0)
+    
     def test_get_performance_summary_global(self):
         """Test global get_performance_summary function."""
         record_request('test_op', 100.0, True)
@@ -357,6 +567,26 @@ class TestGlobalFunctions(unittest.TestCase):
         self.assertIn('uptime_seconds', summary)
         self.assertEqual(summary['total_requests'], 1)
     
+    def test_get_performance_monitor_concurrent_first_call(self):
+        """Test concurrent first calls create a single global monitor."""
+        original_init = PerformanceMonitor.__init__
+        
+        def slow_init(monitor, *args, **kwargs):
+            time.sleep(0.01)
+            original_init(monitor, *args, **kwargs)
+        
+        monitors = []
+        with patch.object(PerformanceMonitor, '__init__', slow_init):
+            threads = [threading.Thread(target=lambda: monitors.append(get_performance_monitor()))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(len(monitors), 8)
+        self.assertTrue(all(monitor is monitors[0] for monitor in monitors))
+    
     @patch('psutil.cpu_percent')
     @patch('psutil.virtual_memory')
     def test_system_monitoring_global(self, mock_memory, mock_cpu):
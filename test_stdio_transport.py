@@ -160,6 +160,34 @@ class TestStdioTransport:
         assert called_request.id == test_request.id
         assert called_request.method == test_request.method
     
+    @patch('sys.stdin')
+    @patch('sys.stdout')
+    def test_input_loop_batch_request(self, mock_stdout, mock_stdin):
+        """测试输入循环处理JSON-RPC批量请求"""
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 2, "method": "ping"}
+        ]
+        
+        mock_stdin.readline.side_effect = [
+            json.dumps(batch) + "\n",
+            ""  # EOF
+        ]
+        
+        self.transport.set_request_handler(lambda req: MCPResponse(id=req.id, result={}))
+        
+        mock_stdout.write = Mock()
+        mock_stdout.flush = Mock()
+        
+        self.transport.start()
+        time.sleep(0.1)
+        
+        # 批量响应作为一个JSON数组写在同一行
+        mock_stdout.write.assert_called_once()
+        response_data = json.loads(mock_stdout.write.call_args[0][0].strip())
+        
+        assert [item["id"] for item in response_data] == [1, 2]
+    
     @patch('sys.stdin')
     @patch('sys.stdout')
     def test_input_loop_invalid_json(self, mock_stdout, mock_stdin):
@@ -6,6 +6,7 @@ and base implementation. It verifies the contract and common functionality
 that all transport implementations must follow.
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from models.mcp_models import MCPRequest, MCPResponse, MCPError
@@ -166,6 +167,49 @@ class TestTransportBaseClass:
         assert response.error.code == -32602  # Invalid params (from error handler)
         assert "Request handling failed: Test exception" in response.error.data["details"]
     
+    def test_handle_batch_falls_back_to_request_handler(self):
+        """测试未设置批量处理器时逐个处理批量请求"""
+        mock_handler = Mock(side_effect=lambda req: MCPResponse(id=req.id, result={}))
+        self.transport.set_request_handler(mock_handler)
+        
+        responses = self.transport._handle_batch([
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 2, "method": "ping"}
+        ])
+        
+        assert [response.id for response in responses] == [1, 2]
+        assert mock_handler.call_count == 2
+    
+    def test_handle_batch_uses_batch_handler(self):
+        """测试设置批量处理器时整批交给批量处理器"""
+        mock_batch_handler = Mock(side_effect=lambda reqs: [MCPResponse(id=r.id, result={}) for r in reqs])
+        self.transport.set_batch_request_handler(mock_batch_handler)
+        
+        responses = self.transport._handle_batch([{"jsonrpc": "2.0", "id": 1, "method": "ping"}, 5])
+        
+        mock_batch_handler.assert_called_once()
+        called_requests = mock_batch_handler.call_args[0][0]
+        assert called_requests[0].method == "ping"
+        assert called_requests[1].method == ""  # 非对象元素转换为无效请求
+        assert len(responses) == 2
+    
+    def test_handle_empty_batch(self):
+        """测试空批量请求返回单个无效请求错误"""
+        response = self.transport._handle_batch([])
+        
+        assert isinstance(response, MCPResponse)
+        assert response.error.code == -32600  # Invalid request
+    
+    def test_serialize_responses(self):
+        """测试响应序列化默认使用to_json，可替换为注册的序列化函数"""
+        responses = [MCPResponse(id=1, result={}), MCPResponse(id=2, result={"a": 1})]
+        
+        assert self.transport._serialize_responses(responses) == json.dumps([r.to_dict() for r in responses])
+        
+        self.transport.set_response_serializer(lambda response: f'"{response.id}"')
+        assert self.transport._serialize_response(responses[0]) == '"1"'
+        assert self.transport._serialize_responses(responses) == '["1", "2"]'
+    
     def test_get_connection_info(self):
         """测试获取连接信息"""
         info = self.transport.get_connection_info()
@@ -73,6 +73,16 @@ class MCPHTTPRequestHandler(BaseHTTPRequestHandler):
             # 解析JSON请求
             try:
                 request_data = json.loads(post_data.decode('utf-8'))
+                
+                if isinstance(request_data, list):
+                    # JSON-RPC批量请求，响应体为JSON数组
+                    responses = self.transport._handle_batch(request_data)
+                    if isinstance(responses, list):
+                        self._send_json_response(200, self.transport._serialize_responses(responses))
+                    else:
+                        self._send_json_response(200, self.transport._serialize_response(responses))
+                    return
+                
                 mcp_request = MCPRequest(
                     jsonrpc=request_data.get('jsonrpc', '2.0'),
                     id=request_data.get('id'),
@@ -84,7 +94,7 @@ class MCPHTTPRequestHandler(BaseHTTPRequestHandler):
                 response = self.transport._handle_request(mcp_request)
                 
                 # 发送响应
-                self._send_json_response(200, response.to_json())
+                self._send_json_response(200, self.transport._serialize_response(response))
                 
             except json.JSONDecodeError as e:
                 # JSON解析错误
@@ -9,7 +9,7 @@ which is the most common transport method for MCP servers.
 import sys
 import json
 import threading
-from typing import Optional
+from typing import List, Optional
 from models.mcp_models import MCPRequest, MCPResponse
 from .transport_interface import Transport
 
@@ -81,7 +81,26 @@ class StdioTransport(Transport):
             raise RuntimeError("Transport is not running")
         
         try:
-            json_response = response.to_json()
+            json_response = self._serialize_response(response)
+            sys.stdout.write(json_response + "\n")
+            sys.stdout.flush()
+        except Exception as e:
+            raise RuntimeError(f"Failed to send response: {e}")
+    
+    def send_responses(self, responses: List[MCPResponse]) -> None:
+        """
+        发送批量MCP响应到标准输出
+        
+        JSON-RPC批量请求的响应作为一个JSON数组写在同一行。
+        
+        Args:
+            responses: 要发送的MCP响应对象列表
+        """
+        if not self._running:
+            raise RuntimeError("Transport is not running")
+        
+        try:
+            json_response = self._serialize_responses(responses)
             sys.stdout.write(json_response + "\n")
             sys.stdout.flush()
         except Exception as e:
@@ -124,7 +143,18 @@ class StdioTransport(Transport):
                     
                     # 解析JSON消息
                     try:
-                        request = MCPRequest.from_json(line)
+                        data = json.loads(line)
+                        
+                        if isinstance(data, list):
+                            # JSON-RPC批量请求，响应以单行JSON数组发送
+                            responses = self._handle_batch(data)
+                            if isinstance(responses, list):
+                                self.send_responses(responses)
+                            else:
+                                self.send_response(responses)
+                            continue
+                        
+                        request = MCPRequest.from_dict(data)
                         
                         # 处理请求并发送响应
                         response = self._handle_request(request)
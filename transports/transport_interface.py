@@ -7,7 +7,7 @@ abstracting away the underlying communication protocol (stdio, HTTP, etc.).
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List, Union
 from models.mcp_models import MCPRequest, MCPResponse
 
 
@@ -108,11 +108,29 @@ class Transport(TransportInterface):
         """初始化传输层基础组件"""
         self._running = False
         self._request_handler: Optional[Callable[[MCPRequest], MCPResponse]] = None
+        self._batch_request_handler: Optional[Callable[[List[MCPRequest]], List[MCPResponse]]] = None
+        self._response_serializer: Callable[[MCPResponse], str] = MCPResponse.to_json
     
     def set_request_handler(self, handler: Callable[[MCPRequest], MCPResponse]) -> None:
         """设置请求处理器"""
         self._request_handler = handler
     
+    def set_batch_request_handler(self, handler: Callable[[List[MCPRequest]], List[MCPResponse]]) -> None:
+        """设置批量请求处理器（可选，未设置时逐个调用请求处理器）"""
+        self._batch_request_handler = handler
+    
+    def set_response_serializer(self, serializer: Callable[[MCPResponse], str]) -> None:
+        """设置响应序列化函数（可选，未设置时使用MCPResponse.to_json）"""
+        self._response_serializer = serializer
+    
+    def _serialize_response(self, response: MCPResponse) -> str:
+        """使用注册的序列化函数将响应转换为JSON文本"""
+        return self._response_serializer(response)
+    
+    def _serialize_responses(self, responses: List[MCPResponse]) -> str:
+        """将批量响应序列化为JSON数组，输出与json.dumps对响应字典列表的结果一致"""
+        return "[" + ", ".join(map(self._response_serializer, responses)) + "]"
+    
     def is_running(self) -> bool:
         """检查传输层运行状态"""
         return self._running
@@ -149,6 +167,43 @@ class Transport(TransportInterface):
                 error=error
             )
     
+    def _handle_batch(self, batch: List[Any]) -> Union[MCPResponse, List[MCPResponse]]:
+        """
+        内部批量请求处理方法
+        
+        处理JSON-RPC批量请求（已解析的JSON数组）。按JSON-RPC 2.0规范，
+        空数组返回单个无效请求错误；非对象元素转换为无效请求，
+        由请求处理器返回对应的错误响应。
+        
+        Args:
+            batch: 已解析的JSON数组
+            
+        Returns:
+            Union[MCPResponse, List[MCPResponse]]: 空批量时为单个错误响应，否则为响应列表
+        """
+        if not batch:
+            from services.error_handler import ErrorHandler
+            error_handler = ErrorHandler()
+            return MCPResponse(
+                error=error_handler.create_invalid_request_error("Empty batch request")
+            )
+        
+        requests = [
+            MCPRequest.from_dict(item) if isinstance(item, dict) else MCPRequest(method="")
+            for item in batch
+        ]
+        
+        if self._batch_request_handler is None:
+            return [self._handle_request(request) for request in requests]
+        
+        try:
+            return self._batch_request_handler(requests)
+        except Exception as e:
+            from services.error_handler import ErrorHandler
+            error_handler = ErrorHandler()
+            error = error_handler.handle_exception(e, "Batch request handling failed")
+            return [MCPResponse(id=request.id, error=error) for request in requests]
+    
     def start(self) -> None:
         """启动传输层 - 子类必须实现"""
         raise NotImplementedError("Subclasses must implement start()")
@@ -0,0 +1,12 @@
+"""
+MCP Base64 Server - Utilities Package
+
+This package contains small, dependency-free helpers shared by the models,
+configuration and service layers.
+"""
+
+from .compat import DATACLASS_SLOTS
+
+__all__ = [
+    'DATACLASS_SLOTS'
+]
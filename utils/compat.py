@@ -0,0 +1,14 @@
+"""
+Python version compatibility helpers.
+
+setup.py still supports Python 3.9, so features that newer interpreters
+provide are enabled here only when available.
+"""
+
+import sys
+from typing import Any, Dict
+
+
+# dataclass(slots=True) is available from Python 3.10. Frequently allocated
+# dataclasses use __slots__ there to save memory and speed up attribute access.
+DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}